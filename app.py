@@ -6,25 +6,40 @@ optimized for deployment on Hugging Face Spaces.
 """
 
 import gradio as gr
+import io
 import os
 import logging
 import tempfile
+import uuid
+from pathlib import Path
 from typing import List, Tuple, Optional
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
 import json
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator: stdlib json is used instead
+    orjson = None
+
 # Import the core application components
 from app.services.ai_menu_processor import AIMenuProcessor
-from app.services.secure_api_client import SecureAPIClient
+from app.services.secure_api_client import get_client
 from app.models.data_models import RequestCache, EnrichedDish, ProcessingError
 from app.config import get_config
 
+def _to_pretty_json(data: dict) -> str:
+    """Serialize results as indented UTF-8 JSON, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize global components with AI-based processor
-api_client = SecureAPIClient()
+api_client = get_client()
 shared_cache = RequestCache()
 menu_processor = AIMenuProcessor(api_client=api_client, cache=shared_cache)
 
@@ -44,15 +59,11 @@ def process_sample_menu() -> str:
         
         # Try to load existing image
         if os.path.exists(sample_path):
-            with open(sample_path, 'rb') as f:
-                image_data = f.read()
+            image_data = Path(sample_path).read_bytes()
             used_path = sample_path
         
         # If no image found, create a simple one
         if not image_data:
-            from PIL import Image, ImageDraw, ImageFont
-            import io
-            
             # Create sample menu image
             width, height = 800, 1000
             image = Image.new('RGB', (width, height), (255, 255, 255))
@@ -61,7 +72,7 @@ def process_sample_menu() -> str:
             # Use default font
             try:
                 font = ImageFont.load_default()
-            except:
+            except OSError:
                 font = None
             
             # Draw sample menu content
@@ -79,7 +90,6 @@ def process_sample_menu() -> str:
             used_path = "generated sample"
         
         # Generate processing ID
-        import uuid
         processing_id = str(uuid.uuid4())[:16]
         
         logger.info(f"Processing sample menu: {processing_id}, using: {used_path}")
@@ -121,14 +131,12 @@ def process_menu_image(image: Image.Image) -> str:
             return "❌ **Error**: Please upload an image first.", "{}"
         
         # Convert PIL image to bytes using BytesIO (Windows-safe)
-        import io
         img_buffer = io.BytesIO()
         image.save(img_buffer, format='JPEG', quality=95)
         image_data = img_buffer.getvalue()
         img_buffer.close()
         
         # Generate processing ID
-        import uuid
         processing_id = str(uuid.uuid4())[:16]
         
         logger.info(f"Processing menu image: {processing_id}, size: {len(image_data)} bytes")
@@ -314,11 +322,11 @@ def format_results_json(dishes: List[EnrichedDish], errors: List[ProcessingError
                 "recoverable": error.recoverable
             })
         
-        return json.dumps(results, indent=2, ensure_ascii=False)
+        return _to_pretty_json(results)
         
     except Exception as e:
         logger.error(f"Error formatting JSON results: {e}")
-        return json.dumps({"error": f"Failed to format results: {str(e)}"}, indent=2)
+        return _to_pretty_json({"error": f"Failed to format results: {str(e)}"})
 
 
 def get_api_status() -> str:
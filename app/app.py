@@ -5,22 +5,34 @@ This module contains the main Flask application factory and configuration
 with enhanced security, CORS support, and secure API key management.
 """
 
-from typing import Optional
-from flask import Flask, request, jsonify, render_template, session, redirect, url_for
+from typing import Any, Dict, Optional
+from flask import Flask, Response, request, jsonify, render_template, session, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import os
+import hashlib
 import logging
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from werkzeug.exceptions import RequestEntityTooLarge, BadRequest
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator: Flask's stdlib JSON provider is used
+    orjson = None
+
 from app.config import get_config, validate_api_credentials
 from app.services.results_service import ResultsService
 from app.services.menu_processor import MenuProcessor
-from app.services.secure_api_client import SecureAPIClient
-from app.models.data_models import EnrichedDish, ProcessingError, ProcessingState, RequestCache
+from app.services.secure_api_client import SecureAPIClient, get_client
+from app.models.data_models import (
+    EnrichedDish, ErrorType, MenuAnalysisResult, ProcessingError, ProcessingState, RequestCache
+)
 
 
 def create_app(config_name: Optional[str] = None) -> Flask:
@@ -35,9 +47,15 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     """
     app = Flask(__name__, template_folder='templates')
     
+    # Use orjson for JSON responses when available
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    
     # Load configuration
     config = get_config(config_name)
     app.config.from_object(config)
+    # Keep the config object itself for routes that use its helper methods
+    app.extensions['menureader_config'] = config
     
     # Configure logging
     configure_logging(app)
@@ -53,7 +71,7 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     configure_rate_limiting(app)
     
     # Initialize secure API client
-    api_client = SecureAPIClient()
+    api_client = get_client()
     
     # Validate API credentials on startup
     validate_startup_credentials(api_client)
@@ -71,6 +89,39 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     return app
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Types orjson cannot encode natively (and dates, so they keep Flask's
+    HTTP-date format) are passed to Flask's default handler.
+    """
+    
+    def _options(self, indent: bool = False) -> int:
+        """Build orjson option flags matching the provider settings."""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=self.default, option=self._options(bool(kwargs.get('indent')))).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize arguments straight to a JSON response body."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 def configure_logging(app: Flask) -> None:
     """Configure application logging."""
     log_level = logging.DEBUG if app.config.get('DEBUG') else logging.INFO
@@ -268,17 +319,66 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
     # Store processing results temporarily (in production, use Redis or database)
     processing_results = {}
     
+    # Menu analyses run on background threads so slow model calls never hold a
+    # request worker; clients poll /status and /results for the outcome
+    analysis_executor = ThreadPoolExecutor(
+        max_workers=app.config.get('ANALYSIS_WORKERS', 16),
+        thread_name_prefix='menu-analysis'
+    )
+    pending_jobs: Dict[str, Future] = {}
+    
+    def start_processing(processing_id: str, image_data: bytes, label: str) -> None:
+        """Queue a menu analysis and store its result once it finishes."""
+        def progress_callback(state: ProcessingState):
+            app.logger.info(f"{label} {processing_id}: {state.current_step.value} - {state.progress}%")
+        
+        def store_result(future: Future) -> None:
+            try:
+                result = future.result()
+            except Exception as processing_error:
+                app.logger.error(f'Processing failed for {processing_id}: {processing_error}', exc_info=True)
+                result = MenuAnalysisResult(errors=[ProcessingError(
+                    type=ErrorType.VALIDATION,
+                    message=f'Menu analysis failed: {str(processing_error)}',
+                    recoverable=False
+                )])
+            processing_results[processing_id] = result
+            pending_jobs.pop(processing_id, None)
+        
+        future = analysis_executor.submit(
+            menu_processor.process_menu,
+            image_data=image_data,
+            processing_id=processing_id,
+            progress_callback=progress_callback
+        )
+        pending_jobs[processing_id] = future
+        future.add_done_callback(store_result)
+    
+    @lru_cache(maxsize=1)
+    def render_index_page():
+        """Render the static main page once and derive its ETag."""
+        html = render_template('index.html').encode('utf-8')
+        return html, hashlib.sha1(html).hexdigest()
+    
     @app.route('/')
     def index():
         """Main application page."""
-        return render_template('index.html')
+        if app.debug:
+            # Pick up template edits while developing
+            render_index_page.cache_clear()
+        
+        html, etag = render_index_page()
+        response = app.response_class(html, mimetype='text/html')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'public, max-age=3600'
+        return response.make_conditional(request)
     
     @app.route('/health')
     def health_check():
         """Health check endpoint with security information."""
         try:
             # Get service status without exposing sensitive information
-            config = app.config
+            config = app.extensions.get('menureader_config')
             api_config = config.get_api_config() if hasattr(config, 'get_api_config') else {}
             
             return jsonify({
@@ -307,7 +407,7 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
     def get_api_config():
         """Get API configuration status (without sensitive data)."""
         try:
-            config = app.config
+            config = app.extensions.get('menureader_config')
             if hasattr(config, 'get_api_config'):
                 api_config = config.get_api_config()
                 return jsonify(api_config)
@@ -321,6 +421,11 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
                 'error': 'Failed to retrieve configuration'
             }), 500
     
+    @app.route('/api/cache-stats')
+    def get_cache_stats():
+        """Get shared cache sizes and AI analysis hit/miss counters."""
+        return jsonify(shared_cache.get_stats())
+    
     
     @app.route('/upload', methods=['POST'])
     @app.limiter.limit("10 per minute") if hasattr(app, 'limiter') else lambda f: f
@@ -361,11 +466,13 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
                     'error_code': 'INVALID_FILE_TYPE'
                 }), 400
             
-            # Read image data
-            image_data = file.read()
+            # Peek at the file header so bad uploads are rejected before the
+            # whole body is read into memory (signatures live in the first bytes)
+            header = file.stream.read(32)
+            file.stream.seek(0)
             
             # Validate image size
-            if len(image_data) == 0:
+            if len(header) == 0:
                 return jsonify({
                     'error': 'Empty file',
                     'message': 'The uploaded file appears to be empty',
@@ -373,13 +480,16 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
                 }), 400
             
             # Additional security: Check for malicious file headers
-            if not is_valid_image_data(image_data):
+            if not is_valid_image_data(header):
                 return jsonify({
                     'error': 'Invalid image data',
                     'message': 'The uploaded file does not appear to be a valid image',
                     'error_code': 'INVALID_IMAGE_DATA'
                 }), 400
             
+            # Read image data
+            image_data = file.read()
+            
             # Generate processing ID
             processing_id = str(uuid.uuid4())[:16]
             
@@ -387,35 +497,15 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
             app.logger.info(f"Image upload started: {processing_id}, size: {len(image_data)} bytes, "
                           f"type: {file.content_type}, client: {request.remote_addr}")
             
-            # Define progress callback for real-time updates
-            def progress_callback(state: ProcessingState):
-                app.logger.info(f"Processing {processing_id}: {state.current_step.value} - {state.progress}%")
+            # Queue processing and return straight away
+            start_processing(processing_id, image_data, 'Processing')
             
-            # Start processing
-            try:
-                result = menu_processor.process_menu(
-                    image_data=image_data,
-                    processing_id=processing_id,
-                    progress_callback=progress_callback
-                )
-                
-                # Store results
-                processing_results[processing_id] = result
-                
-                # Return processing ID for status checking
-                return jsonify({
-                    'processing_id': processing_id,
-                    'message': 'Image uploaded and processing started',
-                    'status': 'processing'
-                })
-                
-            except Exception as processing_error:
-                app.logger.error(f'Processing failed for {processing_id}: {processing_error}', exc_info=True)
-                return jsonify({
-                    'error': 'Processing failed',
-                    'message': f'Menu analysis failed: {str(processing_error)}',
-                    'error_code': 'PROCESSING_FAILED'
-                }), 500
+            # Return processing ID for status checking
+            return jsonify({
+                'processing_id': processing_id,
+                'message': 'Image uploaded and processing started',
+                'status': 'processing'
+            })
             
         except Exception as e:
             app.logger.error(f'Upload error: {e}', exc_info=True)
@@ -475,6 +565,15 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
                     ]
                 })
             
+            # Queued but not yet picked up by a worker
+            if processing_id in pending_jobs:
+                return jsonify({
+                    'processing_id': processing_id,
+                    'status': 'processing',
+                    'progress': 0,
+                    'errors': []
+                })
+            
             # Processing ID not found
             return jsonify({
                 'error': 'Processing ID not found',
@@ -499,6 +598,14 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
                     'message': 'Processing ID format is invalid'
                 }), 400
             
+            # Still running in the background
+            if processing_id in pending_jobs:
+                return jsonify({
+                    'processing_id': processing_id,
+                    'status': 'processing',
+                    'complete': False
+                }), 202
+            
             # Check if results are available
             if processing_id not in processing_results:
                 return jsonify({
@@ -509,34 +616,11 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
             result = processing_results[processing_id]
             
             # Format results for JSON response (without exposing internal data)
-            formatted_dishes = []
-            for enriched_dish in result.dishes:
-                dish_data = {
-                    'id': enriched_dish.dish.id,
-                    'name': enriched_dish.dish.name,
-                    'price': enriched_dish.dish.price,
-                    'confidence': enriched_dish.dish.confidence,
-                    'images': enriched_dish.images,
-                    'description': None,
-                    'processing_status': enriched_dish.processing_status
-                }
-                
-                # Add description if available
-                if enriched_dish.description:
-                    dish_data['description'] = {
-                        'text': enriched_dish.description.text,
-                        'ingredients': enriched_dish.description.ingredients,
-                        'dietary_restrictions': enriched_dish.description.dietary_restrictions,
-                        'cuisine_type': enriched_dish.description.cuisine_type,
-                        'spice_level': enriched_dish.description.spice_level,
-                        'preparation_method': enriched_dish.description.preparation_method,
-                        'confidence': enriched_dish.description.confidence
-                    }
-                
-                formatted_dishes.append(dish_data)
+            formatted_dishes = [format_dish_for_json(enriched_dish) for enriched_dish in result.dishes]
             
             return jsonify({
                 'processing_id': processing_id,
+                'complete': True,
                 'success': result.success,
                 'dishes': formatted_dishes,
                 'processing_time': result.processing_time,
@@ -616,47 +700,22 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
             # Look for user's menu image
             sample_image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'examples', 'images', '1.png')
             
-            if not os.path.exists(sample_image_path):
-                # Create a simple sample menu if it doesn't exist
-                create_sample_menu_image(sample_image_path)
-            
-            with open(sample_image_path, 'rb') as f:
-                image_data = f.read()
+            image_data = load_sample_menu_image(sample_image_path)
             
             # Generate processing ID
             processing_id = str(uuid.uuid4())[:16]
             
             app.logger.info(f"Sample menu processing started: {processing_id}, using: {os.path.basename(sample_image_path)}")
             
-            # Define progress callback
-            def progress_callback(state: ProcessingState):
-                app.logger.info(f"Sample processing {processing_id}: {state.current_step.value} - {state.progress}%")
+            # Queue processing and return straight away
+            start_processing(processing_id, image_data, 'Sample processing')
             
-            # Process the sample menu
-            try:
-                result = menu_processor.process_menu(
-                    image_data=image_data,
-                    processing_id=processing_id,
-                    progress_callback=progress_callback
-                )
-                
-                # Store results
-                processing_results[processing_id] = result
-                
-                return jsonify({
-                    'processing_id': processing_id,
-                    'message': f'Sample menu processing started (using {os.path.basename(sample_image_path)})',
-                    'status': 'processing',
-                    'sample': True
-                })
-                
-            except Exception as processing_error:
-                app.logger.error(f'Sample processing failed for {processing_id}: {processing_error}', exc_info=True)
-                return jsonify({
-                    'error': 'Sample processing failed',
-                    'message': f'Sample menu analysis failed: {str(processing_error)}',
-                    'error_code': 'SAMPLE_PROCESSING_FAILED'
-                }), 500
+            return jsonify({
+                'processing_id': processing_id,
+                'message': f'Sample menu processing started (using {os.path.basename(sample_image_path)})',
+                'status': 'processing',
+                'sample': True
+            })
             
         except Exception as e:
             app.logger.error(f'Sample menu error: {e}', exc_info=True)
@@ -699,6 +758,24 @@ def register_routes(app: Flask, api_client: SecureAPIClient) -> None:
             }), 500
 
 
+@lru_cache(maxsize=1)
+def load_sample_menu_image(path: str) -> bytes:
+    """
+    Read the sample menu image once, creating it first if it doesn't exist.
+    
+    Args:
+        path: Location of the sample menu image
+        
+    Returns:
+        Raw image bytes shared by every sample-menu request
+    """
+    if not os.path.exists(path):
+        # Create a simple sample menu if it doesn't exist
+        create_sample_menu_image(path)
+    
+    return Path(path).read_bytes()
+
+
 def create_sample_menu_image(output_path: str) -> None:
     """
     Create a simple sample menu image for testing.
@@ -725,11 +802,9 @@ def create_sample_menu_image(output_path: str) -> None:
             header_font = ImageFont.truetype("arial.ttf", 24)
             item_font = ImageFont.truetype("arial.ttf", 18)
             price_font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            title_font = ImageFont.load_default()
-            header_font = ImageFont.load_default()
-            item_font = ImageFont.load_default()
-            price_font = ImageFont.load_default()
+        except OSError:
+            # One bundled bitmap font serves every role
+            title_font = header_font = item_font = price_font = ImageFont.load_default()
         
         # Draw restaurant name
         draw.text((width//2, 50), "SAMPLE RESTAURANT", font=title_font, fill=text_color, anchor="mt")
@@ -793,6 +868,36 @@ def create_sample_menu_image(output_path: str) -> None:
             f.write("Sample menu placeholder - PIL not available for image generation")
 
 
+def format_dish_for_json(enriched_dish: EnrichedDish) -> Dict[str, Any]:
+    """
+    Format an enriched dish for the JSON results API.
+    
+    Args:
+        enriched_dish: Processed dish with images and description
+        
+    Returns:
+        Dictionary exposing only the public dish fields
+    """
+    description = enriched_dish.description
+    return {
+        'id': enriched_dish.dish.id,
+        'name': enriched_dish.dish.name,
+        'price': enriched_dish.dish.price,
+        'confidence': enriched_dish.dish.confidence,
+        'images': enriched_dish.images,
+        'description': {
+            'text': description.text,
+            'ingredients': description.ingredients,
+            'dietary_restrictions': description.dietary_restrictions,
+            'cuisine_type': description.cuisine_type,
+            'spice_level': description.spice_level,
+            'preparation_method': description.preparation_method,
+            'confidence': description.confidence
+        } if description else None,
+        'processing_status': enriched_dish.processing_status
+    }
+
+
 def allowed_file(filename: str, allowed_extensions: set) -> bool:
     """
     Check if the uploaded file has an allowed extension.
@@ -4,6 +4,7 @@ Configuration settings for the Menu Image Analyzer application.
 
 import os
 import secrets
+from functools import cached_property
 from typing import Dict, Any, Optional
 import logging
 
@@ -133,6 +134,7 @@ class Config:
     MAX_DISHES_PER_MENU = 50
     MAX_IMAGES_PER_DISH = 5
     REQUEST_TIMEOUT = 30  # seconds
+    ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 16))  # background menu analyses
     
     # Rate limiting settings
     RATELIMIT_STORAGE_URL = os.environ.get('REDIS_URL', 'memory://')
@@ -165,12 +167,7 @@ class Config:
         Returns:
             Dictionary with API configuration status
         """
-        return {
-            'ocr_configured': bool(self.OCR_API_KEY or self.GOOGLE_VISION_API_KEY),
-            'image_search_configured': bool(self.GOOGLE_SEARCH_API_KEY and self.GOOGLE_SEARCH_ENGINE_ID),
-            'ai_description_configured': bool(self.OPENAI_API_KEY),
-            'cors_origins': self.CORS_ORIGINS
-        }
+        return self._api_config
     
     def mask_sensitive_config(self) -> Dict[str, Any]:
         """
@@ -179,6 +176,21 @@ class Config:
         Returns:
             Dictionary with masked sensitive values
         """
+        return self._masked_config
+    
+    # Settings are fixed once the config is built, so both views are computed
+    # on first use and then shared by every health check and config request
+    @cached_property
+    def _api_config(self) -> Dict[str, Any]:
+        return {
+            'ocr_configured': bool(self.OCR_API_KEY or self.GOOGLE_VISION_API_KEY),
+            'image_search_configured': bool(self.GOOGLE_SEARCH_API_KEY and self.GOOGLE_SEARCH_ENGINE_ID),
+            'ai_description_configured': bool(self.OPENAI_API_KEY),
+            'cors_origins': self.CORS_ORIGINS
+        }
+    
+    @cached_property
+    def _masked_config(self) -> Dict[str, Any]:
         def mask_key(key: str) -> str:
             if not key:
                 return "Not configured"
@@ -223,6 +235,9 @@ class ProductionConfig(Config):
     SESSION_COOKIE_SECURE = True
     WTF_CSRF_ENABLED = True
     
+    # Let browsers reuse static assets instead of revalidating them on every page load
+    SEND_FILE_MAX_AGE_DEFAULT = int(os.environ.get('STATIC_MAX_AGE', 12 * 3600))
+    
     def _validate_production_requirements(self) -> None:
         """Validate that all required settings are configured for production."""
         required_env_vars = [
@@ -1,13 +1,19 @@
 """
 Data models for the Menu Image Analyzer application.
 
-This module contains Pydantic models for type-safe data handling throughout the application.
+This module contains Pydantic models and dataclasses for type-safe data handling
+throughout the application.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 from pydantic import BaseModel, Field
+import atexit
+import os
+import pickle
+import threading
 import uuid
 import time
 from datetime import datetime
@@ -60,36 +66,68 @@ class ProcessingState:
             self.start_time = time.time()
 
 
-class Dish(BaseModel):
+@dataclass
+class ServiceStatus:
+    """Availability of one external service used by the processor."""
+    name: str
+    available: bool
+    api_configured: bool
+
+
+def _check_unit_interval(value: float, label: str) -> None:
+    """Raise ValueError unless value lies in [0, 1]."""
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f"{label} must be between 0 and 1, got {value}")
+
+
+# Dishes, images and descriptions are built in bulk for every menu from data the
+# services have already typed, so they are slotted dataclasses with explicit
+# checks rather than pydantic models validated field by field on each construct.
+@dataclass(slots=True)
+class Dish:
     """Core dish data model extracted from menu."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    name: str = Field(..., min_length=1, description="Name of the dish")
-    original_name: str = Field(..., description="Original text from menu")
-    price: Optional[str] = Field(default=None, description="Price as extracted from menu (can be None)")
-    confidence: float = Field(default=0.0, ge=0.0, le=1.0, description="OCR confidence score")
-    position: Dict[str, int] = Field(default_factory=dict, description="Location in original image")
+    name: str  # Name of the dish
+    original_name: str  # Original text from menu
+    price: Optional[str] = None  # Price as extracted from menu (can be None)
+    confidence: float = 0.0  # OCR confidence score
+    position: Dict[str, int] = field(default_factory=dict)  # Location in original image
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    
+    def __post_init__(self):
+        if not self.name:
+            raise ValueError("Dish name must not be empty")
+        _check_unit_interval(self.confidence, "Dish confidence")
 
 
-class FoodImage(BaseModel):
+@dataclass(slots=True)
+class FoodImage:
     """Represents a food image from search results."""
-    url: str = Field(..., description="Full-size image URL")
-    thumbnail_url: str = Field(..., description="Thumbnail image URL")
-    title: str = Field(default="", description="Image title or description")
-    source: str = Field(default="", description="Source website or domain")
-    width: int = Field(default=0, ge=0, description="Image width in pixels")
-    height: int = Field(default=0, ge=0, description="Image height in pixels")
-    load_status: str = Field(default="loading", description="Image loading status")
+    url: str  # Full-size image URL
+    thumbnail_url: str  # Thumbnail image URL
+    title: str = ""  # Image title or description
+    source: str = ""  # Source website or domain
+    width: int = 0  # Image width in pixels
+    height: int = 0  # Image height in pixels
+    load_status: str = "loading"  # Image loading status
+    
+    def __post_init__(self):
+        if self.width < 0 or self.height < 0:
+            raise ValueError(f"Image dimensions must be non-negative, got {self.width}x{self.height}")
 
 
-class DishDescription(BaseModel):
+@dataclass(slots=True)
+class DishDescription:
     """AI-generated description of a dish."""
-    text: str = Field(..., description="Main description text")
-    ingredients: List[str] = Field(default_factory=list, description="List of ingredients")
-    dietary_restrictions: List[str] = Field(default_factory=list, description="Dietary information")
-    cuisine_type: Optional[str] = Field(None, description="Type of cuisine")
-    spice_level: Optional[str] = Field(None, description="Spice level: mild, medium, hot")
-    preparation_method: Optional[str] = Field(None, description="How the dish is prepared")
-    confidence: float = Field(default=0.0, ge=0.0, le=1.0, description="AI confidence score")
+    text: str  # Main description text
+    ingredients: List[str] = field(default_factory=list)
+    dietary_restrictions: List[str] = field(default_factory=list)
+    cuisine_type: Optional[str] = None
+    spice_level: Optional[str] = None  # mild, medium, hot
+    preparation_method: Optional[str] = None
+    confidence: float = 0.0  # AI confidence score
+    
+    def __post_init__(self):
+        _check_unit_interval(self.confidence, "Description confidence")
 
 
 class EnrichedDish(BaseModel):
@@ -134,18 +172,103 @@ class APIConfig(BaseModel):
 class RequestCache:
     """Simple in-memory cache for API requests."""
     
+    # AI analyses run at temperature 0, so identical requests can reuse results
+    AI_ANALYSIS_MAX_ENTRIES = 512
+    AI_ANALYSIS_TTL = 3600.0
+    
     def __init__(self):
         self.ocr_results: Dict[str, OCRResult] = {}
         self.image_search_results: Dict[str, List[FoodImage]] = {}
         self.descriptions: Dict[str, DishDescription] = {}
-        self.ai_analysis_results: Dict[str, List[ParsedDish]] = {}
+        self.ai_analysis_results: "OrderedDict[str, Tuple[float, List[ParsedDish]]]" = OrderedDict()
+        self.ai_analysis_stats: Dict[str, int] = {'hits': 0, 'misses': 0}
+        self._ai_analysis_lock = threading.Lock()
+    
+    @classmethod
+    def persistent(cls, path: str, ttl: float = 86400.0) -> "RequestCache":
+        """
+        Create a cache that is loaded from and saved to a local file.
+        
+        Repeated development runs against the same menus then reuse earlier
+        OCR, AI analysis, image search and description results instead of
+        calling the APIs again. The file is written at interpreter exit and
+        ignored once it is older than ``ttl`` seconds. Only point this at
+        files you created: the contents are unpickled.
+        
+        Args:
+            path: Cache file location (``~`` is expanded)
+            ttl: Maximum age of the saved cache in seconds
+            
+        Returns:
+            RequestCache populated from the file, if present and fresh
+        """
+        cache = cls()
+        cache._persist_path = os.path.expanduser(path)
+        cache._persist_ttl = ttl
+        cache._load()
+        atexit.register(cache.flush)
+        return cache
+    
+    def _load(self) -> None:
+        """Populate the cache from its file, skipping stale or unreadable data."""
+        try:
+            with open(self._persist_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return
+        
+        now = time.time()
+        if snapshot.get('saved_at', 0) + self._persist_ttl < now:
+            return
+        
+        for image_hash, result in snapshot.get('ocr_results', {}).items():
+            self.set_ocr_result(image_hash, result)
+        self.image_search_results.update(snapshot.get('image_search_results', {}))
+        self.descriptions.update(snapshot.get('descriptions', {}))
+        
+        # AI entries carry wall-clock expiries on disk; convert back to monotonic time
+        offset = time.monotonic() - now
+        for image_hash, (expires_at, dishes) in snapshot.get('ai_analysis_results', {}).items():
+            if expires_at > now:
+                self.ai_analysis_results[image_hash] = (expires_at + offset, dishes)
+    
+    def flush(self) -> None:
+        """Write the cache to its file (no-op for in-memory caches)."""
+        path = getattr(self, '_persist_path', None)
+        if not path:
+            return
+        
+        now = time.time()
+        offset = now - time.monotonic()
+        with self._ai_analysis_lock:
+            ai_results = {
+                image_hash: (expires_at + offset, dishes)
+                for image_hash, (expires_at, dishes) in self.ai_analysis_results.items()
+            }
+        
+        snapshot = {
+            'saved_at': now,
+            'ocr_results': dict(self.ocr_results),
+            'image_search_results': dict(self.image_search_results),
+            'descriptions': dict(self.descriptions),
+            'ai_analysis_results': ai_results
+        }
+        
+        # Write to a temporary file first so a crash never leaves a torn cache
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
     
     def clear(self) -> None:
-        """Clear all cached data."""
+        """Clear all cached data and reset the AI analysis hit/miss counters."""
         self.ocr_results.clear()
         self.image_search_results.clear()
         self.descriptions.clear()
-        self.ai_analysis_results.clear()
+        with self._ai_analysis_lock:
+            self.ai_analysis_results.clear()
+            self.ai_analysis_stats.update(hits=0, misses=0)
     
     def get_ocr_result(self, image_hash: str) -> Optional[OCRResult]:
         """Get cached OCR result by image hash."""
@@ -172,9 +295,34 @@ class RequestCache:
         self.descriptions[dish_name] = description
     
     def get_ai_analysis_result(self, image_hash: str) -> Optional[List[ParsedDish]]:
-        """Get cached AI analysis result by image hash."""
-        return self.ai_analysis_results.get(image_hash)
+        """Get cached AI analysis result by image hash, if present and not expired."""
+        with self._ai_analysis_lock:
+            entry = self.ai_analysis_results.get(image_hash)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.ai_analysis_results[image_hash]
+                self.ai_analysis_stats['misses'] += 1
+                return None
+            
+            self.ai_analysis_results.move_to_end(image_hash)
+            self.ai_analysis_stats['hits'] += 1
+            return entry[1]
     
     def set_ai_analysis_result(self, image_hash: str, dishes: List[ParsedDish]) -> None:
-        """Cache AI analysis result by image hash."""
-        self.ai_analysis_results[image_hash] = dishes
\ No newline at end of file
+        """Cache AI analysis result by image hash, evicting the least recently used."""
+        with self._ai_analysis_lock:
+            self.ai_analysis_results[image_hash] = (time.monotonic() + self.AI_ANALYSIS_TTL, dishes)
+            self.ai_analysis_results.move_to_end(image_hash)
+            while len(self.ai_analysis_results) > self.AI_ANALYSIS_MAX_ENTRIES:
+                self.ai_analysis_results.popitem(last=False)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get entry counts for each cache plus AI analysis hit/miss counters."""
+        return {
+            'ocr_results': len(self.ocr_results),
+            'image_search_results': len(self.image_search_results),
+            'descriptions': len(self.descriptions),
+            'ai_analysis_results': len(self.ai_analysis_results),
+            'ai_analysis_hits': self.ai_analysis_stats['hits'],
+            'ai_analysis_misses': self.ai_analysis_stats['misses']
+        }
@@ -6,22 +6,240 @@ dish names and prices from menu images, replacing traditional OCR + parsing appr
 """
 
 import os
-import base64
+import io
+import json
+import asyncio
+import binascii
 import hashlib
-import time
 import logging
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+import httpx
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from PIL import Image, ImageOps
+
+try:
+    import pybase64  # SIMD-accelerated drop-in for the stdlib codec
+
+    def _b64encode_chunk(data: memoryview) -> bytes:
+        """Base64-encode a slice of image bytes using the pybase64 SIMD codec."""
+        return pybase64.b64encode(data)
+except ImportError:
+    def _b64encode_chunk(data: memoryview) -> bytes:
+        """Base64-encode a slice of image bytes through the binascii C codec."""
+        return binascii.b2a_base64(data, newline=False)
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 from app.models.data_models import ParsedDish, ProcessingError, ErrorType, RequestCache
+from app.services.service_utils import RequestPacingMixin, dump_json, get_pooled_session, load_json, parse_json
 
 
 logger = logging.getLogger(__name__)
 
+# Leading magic bytes for the image formats vision models accept
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+# Instructions sent with every menu image
+_ANALYSIS_PROMPT = """
+Analyze this menu image and extract all visible dishes with their names and prices.
+
+IMPORTANT: Return ONLY a valid JSON object with this exact structure:
+{
+  "dishes": [
+    {
+      "dish_name": "exact dish name as shown",
+      "price": "price as shown (including currency symbol if present)"
+    }
+  ]
+}
+
+Rules:
+- Extract ONLY dishes that are clearly visible and readable
+- Use exact dish names as they appear on the menu
+- Include prices exactly as shown (with currency symbols, decimals, etc.)
+- If no price is visible for a dish, use null for the price field
+- Ignore section headers, restaurant names, or non-food items
+- If no dishes are found, return {"dishes": []}
+- Do not include any text outside the JSON object
+"""
+
+# Static prompt content block, marked so providers that support prompt caching
+# (e.g. Anthropic and Gemini via OpenRouter) reuse its tokens across requests
+_PROMPT_BLOCK: Dict[str, Any] = {
+    "type": "text",
+    "text": _ANALYSIS_PROMPT,
+    "cache_control": {"type": "ephemeral"}
+}
+
+# Folded into cache keys so prompt edits never serve stale analyses
+_PROMPT_HASH = hashlib.sha256(_ANALYSIS_PROMPT.encode('utf-8')).digest()
+
+# Decodes individual dish objects out of a partially streamed response
+_JSON_DECODER = json.JSONDecoder()
+
+# Seconds allowed to establish a connection; reads use the analyzer timeout
+_CONNECT_TIMEOUT = 5
+
+# Upper bound on in-flight model requests for one batch of menus
+_MAX_CONCURRENT_ANALYSES = 8
+
+# Vision models tile images at this size; larger uploads only add bytes and tokens
+_MAX_IMAGE_SIDE = 1568
+_MAX_IMAGE_BYTES = 1536 * 1024
+_JPEG_QUALITY = 85
+
+# Base64 is encoded in slices of this many bytes (a multiple of 3, so no padding mid-stream)
+_BASE64_CHUNK = 48 * 1024
+
+# Key prefix and lifetime of analyses shared between workers through Redis
+_SHARED_CACHE_PREFIX = "menureader:analysis:"
+_SHARED_CACHE_TTL = int(os.getenv("AI_CACHE_TTL", "3600"))
 
-class AIMenuAnalyzer:
+# Structured-output schema sent with every analysis request; built once at import
+_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "dishes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "dish_name": {
+                        "type": "string",
+                        "description": "Name of the dish as it appears on the menu"
+                    },
+                    "price": {
+                        "type": ["string", "null"],
+                        "description": "Price as shown on menu with currency symbol, or null if not visible"
+                    }
+                },
+                "required": ["dish_name", "price"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["dishes"],
+    "additionalProperties": False
+}
+
+# Request options that never vary between analyses; spliced into each payload
+_PAYLOAD_OPTIONS: Dict[str, Any] = {
+    "temperature": 0.0,
+    "max_tokens": 2048,
+    "response_format": {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "menu_analysis",
+            "schema": _RESPONSE_SCHEMA
+        }
+    }
+}
+
+
+@lru_cache(maxsize=8)
+def _cache_key_prefix(model_name: str) -> Any:
+    """
+    Get a SHA-256 state already fed the model name and prompt hash.
+    
+    Cache keys copy this state and add only the image bytes, so the static
+    parts of the key are hashed once per model rather than per request.
+    """
+    return hashlib.sha256(model_name.encode('utf-8') + _PROMPT_HASH)
+
+
+def _shrink_image(image_data: bytes) -> bytes:
+    """
+    Downscale and re-encode large photos before they are sent to the model.
+    
+    Phone photos are often several megabytes and well beyond the resolution
+    the model uses, and base64 adds another third on top. Images larger than
+    _MAX_IMAGE_SIDE pixels or _MAX_IMAGE_BYTES are resized to fit and saved
+    as JPEG; smaller images are sent unchanged.
+    
+    Args:
+        image_data: Raw image bytes
+        
+    Returns:
+        Image bytes to embed in the request
+    """
+    try:
+        with Image.open(io.BytesIO(image_data)) as image:
+            if max(image.size) <= _MAX_IMAGE_SIDE and len(image_data) <= _MAX_IMAGE_BYTES:
+                return image_data
+            
+            # JPEG decoders can scale down while decoding
+            image.draft('RGB', (_MAX_IMAGE_SIDE, _MAX_IMAGE_SIDE))
+            # Re-encoding drops EXIF, so apply the camera orientation first
+            resized = ImageOps.exif_transpose(image).convert('RGB')
+            resized.thumbnail((_MAX_IMAGE_SIDE, _MAX_IMAGE_SIDE), Image.Resampling.LANCZOS)
+            
+            buffer = io.BytesIO()
+            resized.save(buffer, format='JPEG', quality=_JPEG_QUALITY, optimize=True)
+    except (OSError, ValueError):
+        return image_data
+    
+    shrunk = buffer.getvalue()
+    return shrunk if len(shrunk) < len(image_data) else image_data
+
+
+def _encode_data_url(mime_type: str, image_data: bytes) -> str:
+    """
+    Base64-encode an image straight into a data URL.
+    
+    Encoding slice by slice into one growing buffer avoids holding a full
+    base64 copy of the image next to its decoded string and the final URL,
+    which matters when many large uploads are in flight at once.
+    
+    Args:
+        mime_type: MIME type of the image
+        image_data: Raw image bytes
+        
+    Returns:
+        ``data:`` URL embedding the image
+    """
+    view = memoryview(image_data)
+    buffer = bytearray(f"data:{mime_type};base64,".encode('ascii'))
+    for start in range(0, len(view), _BASE64_CHUNK):
+        buffer += _b64encode_chunk(view[start:start + _BASE64_CHUNK])
+    return buffer.decode('ascii')
+
+
+@lru_cache(maxsize=1)
+def _get_shared_cache() -> Optional["redis.Redis"]:
+    """
+    Get the Redis client backing the cross-worker analysis cache.
+    
+    The in-process cache is per worker and lost on restart; with REDIS_URL
+    set, analyses are also stored in Redis so one worker's result serves
+    every worker.
+    
+    Returns:
+        Pooled Redis client, or None when Redis is not configured
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url or not redis_url.startswith(('redis://', 'rediss://', 'unix://')):
+        return None
+    
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed; "
+                       "AI analyses will not be shared between workers")
+        return None
+    
+    pool = redis.BlockingConnectionPool.from_url(redis_url, max_connections=32, timeout=1, socket_timeout=1)
+    return redis.Redis(connection_pool=pool)
+
+
+class AIMenuAnalyzer(RequestPacingMixin):
     """
     AI-powered menu analyzer that directly extracts dish information from images.
     
@@ -47,16 +265,18 @@ class AIMenuAnalyzer:
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY environment variable is required")
         
-        # Configure HTTP session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Request headers never change for an analyzer, so build them once
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Shared HTTP session with retry strategy
+        # Completions are billed, so only retry POSTs the API never processed
+        self.session = get_pooled_session(32, 64, retry_post=True)
+        
+        # Second cache tier shared by all workers (None without Redis)
+        self._shared_cache = _get_shared_cache()
         
         # Rate limiting
         self.last_request_time = 0
@@ -77,98 +297,407 @@ class AIMenuAnalyzer:
         Raises:
             Exception: If analysis fails after all retries
         """
-        # Generate cache key from image data
-        image_hash = hashlib.md5(image_data).hexdigest()
-        
-        # Check cache first
-        if self.cache:
-            cached_result = self.cache.get_ai_analysis_result(image_hash)
-            if cached_result:
-                logger.info(f"AI analysis result found in cache for image hash: {image_hash[:8]}...")
-                return cached_result
+        image_hash, cached_result = self._check_cache(image_data)
+        if cached_result is not None:
+            return cached_result
         
         # Rate limiting
         self._enforce_rate_limit()
         
         try:
-            # Convert image to base64
-            img_base64 = base64.b64encode(image_data).decode('utf-8')
-            
-            # Prepare API request with proper response schema
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.model_name,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": self._get_analysis_prompt()
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{img_base64}"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                "temperature": 0.0,
-                "max_tokens": 2048,
-                "response_format": {
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "menu_analysis",
-                        "schema": self._get_response_schema()
-                    }
-                }
-            }
-            
             # Make API request
             response = self.session.post(
                 self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
+                headers=self._headers,
+                data=dump_json(self._build_payload(image_data)),
+                timeout=(_CONNECT_TIMEOUT, self.timeout)
             )
             response.raise_for_status()
             
-            # Parse response
-            result_data = response.json()
-            content = result_data['choices'][0]['message']['content']
+            return self._handle_completion(load_json(response), image_hash)
+            
+        except requests.exceptions.RequestException as e:
+            raise self._analysis_error("AI analysis API request failed", e) from e
+        except json.JSONDecodeError as e:
+            raise self._analysis_error("Failed to parse AI analysis response", e) from e
+        except Exception as e:
+            raise self._analysis_error("AI analysis failed", e) from e
+    
+    async def analyze_menu_async(self, image_data: bytes,
+                                 client: Optional[httpx.AsyncClient] = None) -> List[ParsedDish]:
+        """
+        Async variant of analyze_menu for callers already running an event loop.
+        
+        The model call is awaited rather than holding a thread for its full
+        duration, so many analyses can be in flight on one worker.
+        
+        Args:
+            image_data: Raw image bytes
+            client: Optional shared async client; a temporary one is used otherwise
+            
+        Returns:
+            List of ParsedDish objects with extracted information
+            
+        Raises:
+            Exception: If analysis fails
+        """
+        image_hash, cached_result = self._check_cache(image_data)
+        if cached_result is not None:
+            return cached_result
+        
+        await self._enforce_rate_limit_async()
+        
+        try:
+            request_kwargs = {
+                'headers': self._headers,
+                'content': dump_json(self._build_payload(image_data)),
+                'timeout': httpx.Timeout(self.timeout, connect=_CONNECT_TIMEOUT)
+            }
+            if client is None:
+                async with httpx.AsyncClient() as owned_client:
+                    response = await owned_client.post(self.api_url, **request_kwargs)
+            else:
+                response = await client.post(self.api_url, **request_kwargs)
+            response.raise_for_status()
+            
+            return self._handle_completion(load_json(response), image_hash)
             
-            # Parse JSON response
-            import json
-            analysis_result = json.loads(content)
+        except httpx.HTTPError as e:
+            raise self._analysis_error("AI analysis API request failed", e) from e
+        except json.JSONDecodeError as e:
+            raise self._analysis_error("Failed to parse AI analysis response", e) from e
+        except Exception as e:
+            raise self._analysis_error("AI analysis failed", e) from e
+    
+    def analyze_menus(self, images: List[bytes]) -> List[List[ParsedDish]]:
+        """
+        Analyze several menu images, issuing the model requests concurrently.
+        
+        Args:
+            images: Raw image bytes for each menu
             
-            # Convert to ParsedDish objects
-            dishes = self._convert_to_parsed_dishes(analysis_result)
+        Returns:
+            ParsedDish lists in the same order as the input images
             
-            # Cache the result
-            if self.cache:
-                self.cache.set_ai_analysis_result(image_hash, dishes)
+        Raises:
+            Exception: If any analysis fails
+        """
+        return asyncio.run(self.analyze_menus_async(images))
+    
+    async def analyze_menus_async(self, images: List[bytes]) -> List[List[ParsedDish]]:
+        """
+        Async variant of analyze_menus for callers already running an event loop.
+        
+        Args:
+            images: Raw image bytes for each menu
             
-            logger.info(f"AI analysis successful. Found {len(dishes)} dishes")
-            return dishes
+        Returns:
+            ParsedDish lists in the same order as the input images
+            
+        Raises:
+            Exception: If any analysis fails
+        """
+        # Analyze each distinct image once; repeats share the result instead of
+        # racing the cache with duplicate requests
+        unique_images = list(dict.fromkeys(images))
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ANALYSES)
+        
+        async def analyze(image_data: bytes) -> List[ParsedDish]:
+            async with semaphore:
+                return await self.analyze_menu_async(image_data, client)
+        
+        async with httpx.AsyncClient() as client:
+            results = await asyncio.gather(*[analyze(image_data) for image_data in unique_images])
+        
+        by_image = dict(zip(unique_images, results))
+        return [list(by_image[image_data]) for image_data in images]
+    
+    def analyze_menu_stream(self, image_data: bytes) -> Iterator[ParsedDish]:
+        """
+        Analyze a menu image, yielding dishes as the model streams them.
+        
+        The completion is requested with ``stream: true`` and each dish object
+        is decoded as soon as it is complete, so callers can show the first
+        dishes long before the full response has been generated.
+        
+        Args:
+            image_data: Raw image bytes
+            
+        Yields:
+            ParsedDish objects in menu order
+            
+        Raises:
+            Exception: If analysis fails
+        """
+        image_hash, cached_result = self._check_cache(image_data)
+        if cached_result is not None:
+            yield from cached_result
+            return
+        
+        self._enforce_rate_limit()
+        
+        payload = self._build_payload(image_data)
+        payload["stream"] = True
+        
+        try:
+            with self.session.post(
+                self.api_url,
+                headers=self._headers,
+                data=dump_json(payload),
+                timeout=(_CONNECT_TIMEOUT, self.timeout),
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                # content keeps the whole document; pending only the undecoded tail
+                content = []
+                pending = ""
+                in_array = False
+                dishes: List[ParsedDish] = []
+                for delta in self._iter_stream_deltas(response):
+                    content.append(delta)
+                    pending, in_array, objects = self._decode_streamed_dishes(pending + delta, in_array)
+                    for parsed_dish in self._convert_to_parsed_dishes({"dishes": objects}):
+                        dishes.append(parsed_dish)
+                        yield parsed_dish
+            
+            # Validate the complete document before caching it
+            parse_json("".join(content))
+            self._store_result(image_hash, dishes)
+            logger.info(f"AI analysis stream complete. Found {len(dishes)} dishes")
             
         except requests.exceptions.RequestException as e:
-            error_msg = f"AI analysis API request failed: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+            raise self._analysis_error("AI analysis API request failed", e) from e
         except json.JSONDecodeError as e:
-            error_msg = f"Failed to parse AI analysis response: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+            raise self._analysis_error("Failed to parse AI analysis response", e) from e
         except Exception as e:
-            error_msg = f"AI analysis failed: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+            raise self._analysis_error("AI analysis failed", e) from e
+    
+    @staticmethod
+    def _iter_stream_deltas(response: requests.Response) -> Iterator[str]:
+        """Yield content deltas from a server-sent-events chat completion stream."""
+        # SSE is always UTF-8; decode_unicode would fall back to ISO-8859-1
+        # when the Content-Type has no charset
+        for raw_line in response.iter_lines():
+            line = raw_line.decode('utf-8')
+            # Skip keep-alive comments and blank separators
+            if not line or not line.startswith("data:"):
+                continue
+            
+            data = line[5:].strip()
+            if data == "[DONE]":
+                return
+            
+            delta = parse_json(data)['choices'][0].get('delta', {}).get('content')
+            if delta:
+                yield delta
+    
+    @staticmethod
+    def _decode_streamed_dishes(pending: str, in_array: bool) -> Tuple[str, bool, List[Dict[str, Any]]]:
+        """
+        Decode any dish objects completed in a partially streamed response.
+        
+        Args:
+            pending: Response text not yet decoded into dishes
+            in_array: Whether the dishes array has already been opened
+            
+        Returns:
+            Remaining undecoded text, updated in_array flag and the newly completed dish objects
+        """
+        position = 0
+        if not in_array:
+            key = pending.find('"dishes"')
+            start = pending.find('[', key) if key != -1 else -1
+            if start == -1:
+                return pending, False, []
+            position = start + 1
+        
+        objects = []
+        length = len(pending)
+        while True:
+            while position < length and pending[position] in ' \t\r\n,':
+                position += 1
+            if position >= length or pending[position] != '{':
+                break
+            try:
+                obj, end = _JSON_DECODER.raw_decode(pending, position)
+            except json.JSONDecodeError:
+                # The object is still being streamed
+                break
+            objects.append(obj)
+            position = end
+        
+        return pending[position:], True, objects
+    
+    def _check_cache(self, image_data: bytes) -> Tuple[str, Optional[List[ParsedDish]]]:
+        """
+        Look up a cached analysis for an image, in-process first, then shared.
+        
+        Args:
+            image_data: Raw image bytes
+            
+        Returns:
+            Cache key and cached dishes (if any)
+        """
+        # Generate cache key from image data, model and prompt
+        image_hash = self._analysis_cache_key(image_data)
+        
+        if self.cache:
+            cached_result = self.cache.get_ai_analysis_result(image_hash)
+            if cached_result is not None:
+                logger.info(f"AI analysis result found in cache for image hash: {image_hash[:8]}...")
+                return image_hash, cached_result
+            
+            shared_result = self._load_shared_result(image_hash)
+            if shared_result is not None:
+                logger.info(f"AI analysis result found in shared cache for image hash: {image_hash[:8]}...")
+                self.cache.set_ai_analysis_result(image_hash, shared_result)
+                return image_hash, shared_result
+        
+        return image_hash, None
+    
+    def _build_payload(self, image_data: bytes) -> Dict[str, Any]:
+        """
+        Build the chat completion payload with the proper response schema.
+        
+        Args:
+            image_data: Raw image bytes
+            
+        Returns:
+            Request payload for the model API
+        """
+        return {
+            "model": self.model_name,
+            "messages": [
+                {
+                    "role": "user",
+                    # Static prompt first so the cacheable prefix is shared
+                    "content": [_PROMPT_BLOCK, self._build_image_part(image_data)]
+                }
+            ],
+            **_PAYLOAD_OPTIONS
+        }
+    
+    def _handle_completion(self, result_data: Dict[str, Any], image_hash: str) -> List[ParsedDish]:
+        """
+        Convert a chat completion response into dishes and cache them.
+        
+        Args:
+            result_data: Decoded API response
+            image_hash: Cache key for the analysed image
+            
+        Returns:
+            List of ParsedDish objects
+        """
+        content = result_data['choices'][0]['message']['content']
+        
+        cached_tokens = ((result_data.get('usage') or {}).get('prompt_tokens_details') or {}).get('cached_tokens')
+        if cached_tokens:
+            logger.debug(f"AI analysis reused {cached_tokens} cached prompt tokens")
+        
+        # Parse JSON response
+        analysis_result = parse_json(content)
+        
+        # Convert to ParsedDish objects
+        dishes = self._convert_to_parsed_dishes(analysis_result)
+        
+        # Cache the result
+        self._store_result(image_hash, dishes)
+        
+        logger.info(f"AI analysis successful. Found {len(dishes)} dishes")
+        return dishes
+    
+    def _load_shared_result(self, image_hash: str) -> Optional[List[ParsedDish]]:
+        """Fetch an analysis from the shared Redis cache, if configured."""
+        if self._shared_cache is None:
+            return None
+        
+        try:
+            raw = self._shared_cache.get(_SHARED_CACHE_PREFIX + image_hash)
+        except redis.RedisError as e:
+            logger.warning(f"Shared AI analysis cache unavailable: {e}")
+            return None
+        
+        if raw is None:
+            return None
+        
+        try:
+            return [ParsedDish.model_validate(dish) for dish in parse_json(raw)]
+        except ValueError as e:
+            # Corrupt or outdated entry; fall back to a fresh analysis
+            logger.warning(f"Ignoring unreadable shared AI analysis cache entry: {e}")
+            return None
+    
+    def _store_result(self, image_hash: str, dishes: List[ParsedDish]) -> None:
+        """Cache an analysis in-process and, when configured, in the shared Redis cache."""
+        if self.cache:
+            self.cache.set_ai_analysis_result(image_hash, dishes)
+        
+        if self._shared_cache is None:
+            return
+        
+        try:
+            self._shared_cache.setex(
+                _SHARED_CACHE_PREFIX + image_hash,
+                _SHARED_CACHE_TTL,
+                dump_json([dish.model_dump() for dish in dishes])
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to store AI analysis in shared cache: {e}")
+    
+    @staticmethod
+    def _analysis_error(message: str, error: Exception) -> Exception:
+        """Log an analysis failure and wrap it for callers."""
+        error_msg = f"{message}: {str(error)}"
+        logger.error(error_msg)
+        return Exception(error_msg)
+    
+    def _analysis_cache_key(self, image_data: bytes) -> str:
+        """
+        Build an exact-match cache key for an analysis request.
+        
+        Args:
+            image_data: Raw image bytes
+            
+        Returns:
+            SHA-256 hex digest of the image, model name and prompt
+        """
+        hasher = _cache_key_prefix(self.model_name).copy()
+        hasher.update(image_data)
+        return hasher.hexdigest()
+    
+    @staticmethod
+    def _build_image_part(image_data: bytes) -> Dict[str, Any]:
+        """
+        Build the image content part for a chat completion request.
+        
+        Oversized photos are downscaled first. The MIME type is detected from
+        the image bytes so PNG/GIF/WebP uploads are not mislabelled as JPEG
+        and re-encoded server-side.
+        
+        Args:
+            image_data: Raw image bytes
+            
+        Returns:
+            Message content part embedding the image as a data URL
+        """
+        image_data = _shrink_image(image_data)
+        
+        mime_type = 'image/jpeg'
+        if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+            mime_type = 'image/webp'
+        else:
+            for signature, signature_mime in _IMAGE_SIGNATURES:
+                if image_data.startswith(signature):
+                    mime_type = signature_mime
+                    break
+        
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": _encode_data_url(mime_type, image_data)
+            }
+        }
     
     def _get_analysis_prompt(self) -> str:
         """
@@ -177,28 +706,7 @@ class AIMenuAnalyzer:
         Returns:
             Formatted prompt string
         """
-        return """
-Analyze this menu image and extract all visible dishes with their names and prices.
-
-IMPORTANT: Return ONLY a valid JSON object with this exact structure:
-{
-  "dishes": [
-    {
-      "dish_name": "exact dish name as shown",
-      "price": "price as shown (including currency symbol if present)"
-    }
-  ]
-}
-
-Rules:
-- Extract ONLY dishes that are clearly visible and readable
-- Use exact dish names as they appear on the menu
-- Include prices exactly as shown (with currency symbols, decimals, etc.)
-- If no price is visible for a dish, use null for the price field
-- Ignore section headers, restaurant names, or non-food items
-- If no dishes are found, return {"dishes": []}
-- Do not include any text outside the JSON object
-"""
+        return _ANALYSIS_PROMPT
     
     def _get_response_schema(self) -> Dict[str, Any]:
         """
@@ -207,31 +715,7 @@ Rules:
         Returns:
             JSON schema dictionary for menu analysis response
         """
-        return {
-            "type": "object",
-            "properties": {
-                "dishes": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "dish_name": {
-                                "type": "string",
-                                "description": "Name of the dish as it appears on the menu"
-                            },
-                            "price": {
-                                "type": ["string", "null"],
-                                "description": "Price as shown on menu with currency symbol, or null if not visible"
-                            }
-                        },
-                        "required": ["dish_name", "price"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            "required": ["dishes"],
-            "additionalProperties": False
-        }
+        return _RESPONSE_SCHEMA
     
     def _convert_to_parsed_dishes(self, analysis_result: Dict[str, Any]) -> List[ParsedDish]:
         """
@@ -278,21 +762,13 @@ Rules:
         
         return dishes
     
-    def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-    
     def validate_api_key(self) -> bool:
         """
         Validate that the API key is working.
         
+        AIMenuProcessor calls this at startup, so it also primes DNS, TLS and
+        the shared connection pool before the first real analysis.
+        
         Returns:
             True if API key is valid, False otherwise
         """
@@ -301,11 +777,6 @@ Rules:
         
         try:
             # Create a minimal test request
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.model_name,
                 "messages": [{"role": "user", "content": "Test"}],
@@ -314,13 +785,13 @@ Rules:
             
             response = self.session.post(
                 self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=10
+                headers=self._headers,
+                data=dump_json(payload),
+                timeout=(_CONNECT_TIMEOUT, 10)
             )
             
             return response.status_code == 200
             
         except Exception as e:
             logger.error(f"API key validation failed: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -12,12 +12,13 @@ import hashlib
 from typing import List, Optional, Dict, Any, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+from dataclasses import asdict
 
 from app.models.data_models import (
     MenuAnalysisResult, EnrichedDish, Dish, ProcessingState, ProcessingStep,
     ProcessingError, ErrorType, ParsedDish, RequestCache
 )
-from app.services.secure_api_client import SecureAPIClient, APIProvider
+from app.services.secure_api_client import SecureAPIClient, APIProvider, get_client
 from app.services.ai_menu_analyzer import AIMenuAnalyzer
 from app.services.image_search_service import ImageSearchService
 from app.services.description_service import DescriptionService
@@ -43,7 +44,7 @@ class AIMenuProcessor:
             api_client: Secure API client for external service communication
             cache: Optional shared cache instance
         """
-        self.api_client = api_client or SecureAPIClient()
+        self.api_client = api_client or get_client()
         self.cache = cache or RequestCache()
         self.logger = logging.getLogger(__name__)
         
@@ -339,8 +340,8 @@ class AIMenuProcessor:
                         search_name, max_results=5
                     )
                     if food_images:
-                        images['primary'] = food_images[0].model_dump()
-                        images['secondary'] = [img.model_dump() for img in food_images[1:]] if len(food_images) > 1 else []
+                        images['primary'] = asdict(food_images[0])
+                        images['secondary'] = [asdict(img) for img in food_images[1:]] if len(food_images) > 1 else []
                     else:
                         images['placeholder'] = True
                 except Exception as e:
@@ -376,17 +377,20 @@ class AIMenuProcessor:
     def _update_progress(self, processing_id: str, step: ProcessingStep, progress: int) -> None:
         """Update processing progress and notify callbacks."""
         with self.state_lock:
-            if processing_id in self.processing_states:
-                state = self.processing_states[processing_id]
-                state.current_step = step
-                state.progress = progress
-                
-                # Notify progress callback if registered
-                if processing_id in self.progress_callbacks:
-                    try:
-                        self.progress_callbacks[processing_id](state)
-                    except Exception as e:
-                        self.logger.error(f"Progress callback failed: {str(e)}")
+            state = self.processing_states.get(processing_id)
+            if state is None:
+                return
+            state.current_step = step
+            state.progress = progress
+            callback = self.progress_callbacks.get(processing_id)
+        
+        # Notify the progress callback outside the lock so slow callbacks
+        # (logging, printing) never stall other threads' progress updates
+        if callback is not None:
+            try:
+                callback(state)
+            except Exception as e:
+                self.logger.error(f"Progress callback failed: {str(e)}")
     
     def _add_error(self, processing_id: str, error: ProcessingError) -> None:
         """Add an error to the processing state."""
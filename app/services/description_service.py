@@ -12,9 +12,40 @@ from typing import Optional, List, Dict, Any
 import openai
 from openai import OpenAI
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 
 from ..models.data_models import DishDescription, ProcessingError, ErrorType
+from .service_utils import parse_json
+
+
+# Static part of the description prompt; only the dish details vary per call
+_DESCRIPTION_PROMPT_TEMPLATE = """You are a knowledgeable food expert helping diners understand menu items. 
+Generate a comprehensive description for the following dish that will help someone decide whether to order it.
+
+Dish Name: {dish_details}
+
+Please provide a JSON response with the following structure:
+{{
+    "text": "A concise, appetizing description (2-3 sentences) that explains what the dish is and what makes it special",
+    "ingredients": ["list", "of", "key", "ingredients"],
+    "dietary_restrictions": ["vegetarian", "vegan", "gluten-free", "dairy-free", "nut-free", "spicy", etc.],
+    "cuisine_type": "Type of cuisine (e.g., Italian, Thai, Mexican, etc.)",
+    "spice_level": "mild, medium, or hot (if applicable)",
+    "preparation_method": "Brief description of how it's prepared (e.g., grilled, fried, steamed, etc.)",
+    "confidence": 0.85
+}}
+
+Guidelines:
+- Keep the main description appetizing and informative
+- Only include dietary restrictions that are clearly applicable
+- Be specific about ingredients when possible
+- Include cultural context if the dish is from a specific tradition
+- Set confidence between 0.7-0.95 based on how well-known the dish is
+- If you're unsure about any field, use null or empty array
+- Focus on helping diners make informed choices
+
+Respond only with valid JSON."""
 
 
 class DescriptionService:
@@ -89,42 +120,13 @@ class DescriptionService:
         Returns:
             Formatted prompt string
         """
-        prompt = f"""You are a knowledgeable food expert helping diners understand menu items. 
-Generate a comprehensive description for the following dish that will help someone decide whether to order it.
-
-Dish Name: {dish_name}"""
-        
+        dish_details = dish_name
         if price:
-            prompt += f"\nPrice: {price}"
-        
+            dish_details += f"\nPrice: {price}"
         if menu_context:
-            prompt += f"\nMenu Context: {menu_context}"
+            dish_details += f"\nMenu Context: {menu_context}"
         
-        prompt += """
-
-Please provide a JSON response with the following structure:
-{
-    "text": "A concise, appetizing description (2-3 sentences) that explains what the dish is and what makes it special",
-    "ingredients": ["list", "of", "key", "ingredients"],
-    "dietary_restrictions": ["vegetarian", "vegan", "gluten-free", "dairy-free", "nut-free", "spicy", etc.],
-    "cuisine_type": "Type of cuisine (e.g., Italian, Thai, Mexican, etc.)",
-    "spice_level": "mild, medium, or hot (if applicable)",
-    "preparation_method": "Brief description of how it's prepared (e.g., grilled, fried, steamed, etc.)",
-    "confidence": 0.85
-}
-
-Guidelines:
-- Keep the main description appetizing and informative
-- Only include dietary restrictions that are clearly applicable
-- Be specific about ingredients when possible
-- Include cultural context if the dish is from a specific tradition
-- Set confidence between 0.7-0.95 based on how well-known the dish is
-- If you're unsure about any field, use null or empty array
-- Focus on helping diners make informed choices
-
-Respond only with valid JSON."""
-        
-        return prompt
+        return _DESCRIPTION_PROMPT_TEMPLATE.format(dish_details=dish_details)
     
     def _make_api_call(self, prompt: str, max_retries: int = 3) -> Optional[str]:
         """
@@ -196,7 +198,7 @@ Respond only with valid JSON."""
                 response = response[:-3]
             response = response.strip()
             
-            data = json.loads(response)
+            data = parse_json(response)
             
             # Validate and extract fields with defaults
             return DishDescription(
@@ -241,32 +243,29 @@ Respond only with valid JSON."""
     def generate_batch_descriptions(self, dishes: List[Dict[str, str]], 
                                   max_concurrent: int = 3) -> List[DishDescription]:
         """
-        Generate descriptions for multiple dishes with rate limiting.
+        Generate descriptions for multiple dishes in parallel.
+        
+        Requests are fanned out over a small thread pool so a batch takes roughly
+        as long as its slowest dish instead of the sum of all of them.
         
         Args:
             dishes: List of dish dictionaries with 'name' and optional 'price'
             max_concurrent: Maximum concurrent API calls
             
         Returns:
-            List of DishDescription objects
+            List of DishDescription objects, in the same order as ``dishes``
         """
-        descriptions = []
+        if not dishes:
+            return []
         
-        for dish in dishes:
+        def describe(dish: Dict[str, str]) -> DishDescription:
             dish_name = dish.get('name', '')
-            price = dish.get('price', '')
-            
             if not dish_name:
-                descriptions.append(self._create_fallback_description("Unknown Dish"))
-                continue
-            
-            description = self.generate_description(dish_name, price)
-            descriptions.append(description)
-            
-            # Small delay to respect rate limits
-            time.sleep(0.1)
+                return self._create_fallback_description("Unknown Dish")
+            return self.generate_description(dish_name, dish.get('price', ''))
         
-        return descriptions
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(dishes)))) as executor:
+            return list(executor.map(describe, dishes))
     
     def is_available(self) -> bool:
         """
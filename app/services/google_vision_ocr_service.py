@@ -6,16 +6,19 @@ with support for both service account authentication and API key authentication.
 """
 
 import os
-import hashlib
 import time
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 import base64
 
 from app.models.data_models import OCRResult, RequestCache
+from app.services.service_utils import get_pooled_session, hash_image
 
 logger = logging.getLogger(__name__)
 
+# Images per BatchAnnotateImages call (the Vision API limit for inline content)
+_MAX_BATCH_SIZE = 16
+
 
 class GoogleVisionOCRService:
     """
@@ -35,6 +38,10 @@ class GoogleVisionOCRService:
         self.cache = cache or RequestCache()
         self.timeout = timeout
         
+        # Pooled session shared with OCRService, so REST calls from any thread
+        # reuse warm connections to the Vision endpoint
+        self.session = get_pooled_session(64, 64)
+        
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 0.1  # 100ms between requests
@@ -70,7 +77,7 @@ class GoogleVisionOCRService:
             OCRResult with extracted text and metadata
         """
         # Generate cache key from image data
-        image_hash = hashlib.md5(image_data).hexdigest()
+        image_hash = hash_image(image_data)
         
         # Check cache first
         if self.cache:
@@ -102,6 +109,62 @@ class GoogleVisionOCRService:
             logger.error(error_msg)
             raise Exception(error_msg) from e
     
+    def extract_text_batch(self, images: List[bytes],
+                           language_hints: Optional[List[str]] = None) -> List[OCRResult]:
+        """
+        Extract text from several images with batched Vision API calls.
+        
+        Uncached images are sent up to 16 per BatchAnnotateImages request, so
+        N images cost ceil(N / 16) round trips instead of N.
+        
+        Args:
+            images: List of raw image bytes
+            language_hints: Optional list of language codes to help OCR
+            
+        Returns:
+            List of OCRResult objects in the same order as the input images
+            
+        Raises:
+            Exception: If OCR processing fails for any image
+        """
+        image_hashes = [hash_image(image_data) for image_data in images]
+        results: Dict[str, OCRResult] = {}
+        pending: Dict[str, bytes] = {}
+        
+        for image_hash, image_data in zip(image_hashes, images):
+            cached_result = self.cache.get_ocr_result(image_hash) if self.cache else None
+            if cached_result:
+                results[image_hash] = cached_result
+            else:
+                pending.setdefault(image_hash, image_data)
+        
+        pending_items = list(pending.items())
+        for start in range(0, len(pending_items), _MAX_BATCH_SIZE):
+            chunk = pending_items[start:start + _MAX_BATCH_SIZE]
+            chunk_images = [image_data for _, image_data in chunk]
+            
+            # Rate limiting applies per API call, not per image
+            self._enforce_rate_limit()
+            
+            try:
+                if self.use_service_account and self.vision_client:
+                    chunk_results = self._batch_extract_with_client_library(chunk_images, language_hints)
+                else:
+                    chunk_results = self._batch_extract_with_rest_api(chunk_images, language_hints)
+            except Exception as e:
+                error_msg = f"Google Vision OCR processing failed: {str(e)}"
+                logger.error(error_msg)
+                raise Exception(error_msg) from e
+            
+            for (image_hash, _), result in zip(chunk, chunk_results):
+                results[image_hash] = result
+                if self.cache:
+                    self.cache.set_ocr_result(image_hash, result)
+            
+            logger.info(f"Batch OCR extraction successful for {len(chunk)} images")
+        
+        return [results[image_hash] for image_hash in image_hashes]
+    
     def _extract_with_client_library(self, image_data: bytes, language_hints: Optional[List[str]] = None) -> OCRResult:
         """Extract text using Google Cloud Vision client library."""
         from google.cloud import vision
@@ -121,6 +184,28 @@ class GoogleVisionOCRService:
             timeout=self.timeout
         )
         
+        return self._parse_client_response(response)
+    
+    def _batch_extract_with_client_library(self, images: List[bytes],
+                                           language_hints: Optional[List[str]] = None) -> List[OCRResult]:
+        """Extract text from up to 16 images in one client library batch call."""
+        from google.cloud import vision
+        
+        image_context = vision.ImageContext(language_hints=language_hints) if language_hints else None
+        annotate_requests = [
+            vision.AnnotateImageRequest(
+                image=vision.Image(content=image_data),
+                features=[vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)],
+                image_context=image_context
+            )
+            for image_data in images
+        ]
+        
+        batch_response = self.vision_client.batch_annotate_images(requests=annotate_requests, timeout=self.timeout)
+        return [self._parse_client_response(response) for response in batch_response.responses]
+    
+    def _parse_client_response(self, response) -> OCRResult:
+        """Convert a client library AnnotateImageResponse into an OCRResult."""
         # Check for errors
         if response.error.message:
             raise Exception(f"Google Vision API error: {response.error.message}")
@@ -166,33 +251,34 @@ class GoogleVisionOCRService:
     
     def _extract_with_rest_api(self, image_data: bytes, language_hints: Optional[List[str]] = None) -> OCRResult:
         """Extract text using Google Vision REST API."""
-        import requests
-        
+        return self._batch_extract_with_rest_api([image_data], language_hints)[0]
+    
+    def _batch_extract_with_rest_api(self, images: List[bytes],
+                                     language_hints: Optional[List[str]] = None) -> List[OCRResult]:
+        """Extract text from up to 16 images in one REST images:annotate call."""
         # Get API key from environment
         api_key = os.environ.get('OCR_API_KEY')
         if not api_key:
             raise Exception("OCR_API_KEY environment variable not set")
         
-        # Prepare request payload
-        image_b64 = base64.b64encode(image_data).decode('utf-8')
-        
         features = [{"type": "TEXT_DETECTION"}]
         
+        # Prepare request payload, one entry per image
         payload = {
             "requests": [{
-                "image": {"content": image_b64},
+                "image": {"content": base64.b64encode(image_data).decode('utf-8')},
                 "features": features,
                 "imageContext": {
                     "languageHints": language_hints or []
                 }
-            }]
+            } for image_data in images]
         }
         
         # Make API request
         url = f"https://vision.googleapis.com/v1/images:annotate?key={api_key}"
         headers = {"Content-Type": "application/json"}
         
-        response = requests.post(
+        response = self.session.post(
             url,
             json=payload,
             headers=headers,
@@ -207,10 +293,15 @@ class GoogleVisionOCRService:
             raise Exception(f"Google Vision API error: {result_data['error']}")
         
         responses = result_data.get("responses", [])
-        if not responses:
-            return OCRResult(text="", confidence=0.0, language="unknown")
-        
-        response_data = responses[0]
+        return [
+            self._parse_rest_response(responses[index] if index < len(responses) else {})
+            for index in range(len(images))
+        ]
+    
+    def _parse_rest_response(self, response_data: Dict[str, Any]) -> OCRResult:
+        """Convert one REST AnnotateImageResponse into an OCRResult."""
+        if "error" in response_data:
+            raise Exception(f"Google Vision API error: {response_data['error']}")
         
         # Extract text annotations
         text_annotations = response_data.get("textAnnotations", [])
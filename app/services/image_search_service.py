@@ -5,22 +5,30 @@ This module provides food image search functionality using Google Custom Search
 with quality filtering, metadata extraction, caching, and comprehensive error handling.
 """
 
+import asyncio
 import hashlib
-import time
 import logging
+import re
+from operator import itemgetter
 from typing import List, Optional, Dict, Any
+import httpx
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from urllib.parse import quote_plus
 
 from app.models.data_models import FoodImage, ProcessingError, ErrorType, RequestCache
+from app.services.service_utils import RequestPacingMixin, get_pooled_session
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on in-flight Custom Search requests for one batch
+_MAX_CONCURRENT_SEARCHES = 10
 
-class ImageSearchService:
+# Titles that mark obvious non-food results, matched case-insensitively
+_REJECTED_TITLE_RE = re.compile(r"logo", re.IGNORECASE)
+
+
+class ImageSearchService(RequestPacingMixin):
     """
     Service for searching food images using Google Custom Search API.
     
@@ -44,16 +52,8 @@ class ImageSearchService:
         self.cache = cache or RequestCache()
         self.timeout = timeout
         
-        # Configure HTTP session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Shared HTTP session with retry strategy
+        self.session = get_pooled_session(_MAX_CONCURRENT_SEARCHES, _MAX_CONCURRENT_SEARCHES)
         
         # Rate limiting - Google Custom Search allows 100 queries per day for free
         self.last_request_time = 0
@@ -113,28 +113,125 @@ class ImageSearchService:
         try:
             # Perform the search
             images = self._perform_search(dish_name, max_results)
+            return self._finish_search(dish_name, normalized_name, images, max_results)
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Image search API request failed for '{dish_name}': {str(e)}")
+            return self._get_placeholder_images()
+        except Exception as e:
+            logger.error(f"Image search failed for '{dish_name}': {str(e)}")
+            return self._get_placeholder_images()
+    
+    def search_food_images_batch(self, dish_names: List[str],
+                                 max_results: int = 5) -> List[List[FoodImage]]:
+        """
+        Search for images of several dishes, issuing the API requests concurrently.
+        
+        Args:
+            dish_names: Names of the dishes to search for
+            max_results: Maximum number of images to return per dish
             
-            # Filter and validate images
-            filtered_images = self._filter_and_validate_images(images)
+        Returns:
+            List of FoodImage lists in the same order as the input dish names
+        """
+        return asyncio.run(self.search_food_images_batch_async(dish_names, max_results))
+    
+    async def search_food_images_batch_async(self, dish_names: List[str],
+                                             max_results: int = 5) -> List[List[FoodImage]]:
+        """
+        Async variant of search_food_images_batch for callers already running an event loop.
+        
+        Args:
+            dish_names: Names of the dishes to search for
+            max_results: Maximum number of images to return per dish
             
-            # If no good images found, add placeholder
-            if not filtered_images:
-                logger.info(f"No quality images found for '{dish_name}', using placeholder")
-                filtered_images = self._get_placeholder_images()
+        Returns:
+            List of FoodImage lists in the same order as the input dish names
+        """
+        # Search each distinct dish once; repeats share the result instead of
+        # racing the cache with duplicate requests
+        unique_names: Dict[str, str] = {}
+        for dish_name in dish_names:
+            unique_names.setdefault((dish_name or '').strip().lower(), dish_name)
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            results = await asyncio.gather(*[
+                self.search_food_images_async(dish_name, max_results, client, semaphore)
+                for dish_name in unique_names.values()
+            ])
+        
+        by_name = dict(zip(unique_names, results))
+        return [list(by_name[(dish_name or '').strip().lower()]) for dish_name in dish_names]
+    
+    async def search_food_images_async(self, dish_name: str, max_results: int = 5,
+                                       client: Optional[httpx.AsyncClient] = None,
+                                       semaphore: Optional[asyncio.Semaphore] = None) -> List[FoodImage]:
+        """
+        Async variant of search_food_images.
+        
+        Args:
+            dish_name: Name of the dish to search for
+            max_results: Maximum number of images to return
+            client: Optional shared async client; a temporary one is used otherwise
+            semaphore: Optional semaphore bounding concurrent requests
             
-            # Cache the result
-            self.cache.set_image_search_result(normalized_name, filtered_images)
+        Returns:
+            List of FoodImage objects with metadata
+        """
+        if not dish_name or not dish_name.strip():
+            logger.warning("Empty dish name provided for image search")
+            return self._get_placeholder_images()
+        
+        normalized_name = dish_name.strip().lower()
+        
+        cached_result = self.cache.get_image_search_result(normalized_name)
+        if cached_result:
+            logger.info(f"Image search result found in cache for: {dish_name}")
+            return cached_result[:max_results]
+        
+        if not self._can_make_request():
+            logger.warning("Rate limit or quota exceeded, returning placeholder images")
+            return self._get_placeholder_images()
+        
+        try:
+            async with semaphore or asyncio.Semaphore(1):
+                await self._enforce_rate_limit_async()
+                params = self._build_search_params(dish_name, max_results)
+                if client is None:
+                    async with httpx.AsyncClient(timeout=self.timeout) as owned_client:
+                        response = await owned_client.get(self.base_url, params=params)
+                else:
+                    response = await client.get(self.base_url, params=params)
+                response.raise_for_status()
             
-            logger.info(f"Image search successful for '{dish_name}': {len(filtered_images)} images")
-            return filtered_images[:max_results]
+            images = self._parse_search_response(response.json(), dish_name)
+            return self._finish_search(dish_name, normalized_name, images, max_results)
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Image search API request failed for '{dish_name}': {str(e)}")
             return self._get_placeholder_images()
         except Exception as e:
             logger.error(f"Image search failed for '{dish_name}': {str(e)}")
             return self._get_placeholder_images()
     
+    def _finish_search(self, dish_name: str, normalized_name: str,
+                       images: List[Dict[str, Any]], max_results: int) -> List[FoodImage]:
+        """Filter raw search results, fall back to placeholders and cache the outcome."""
+        # Filter and validate images
+        filtered_images = self._filter_and_validate_images(images)
+        
+        # If no good images found, add placeholder
+        if not filtered_images:
+            logger.info(f"No quality images found for '{dish_name}', using placeholder")
+            filtered_images = self._get_placeholder_images()
+        
+        # Cache the result
+        self.cache.set_image_search_result(normalized_name, filtered_images)
+        
+        logger.info(f"Image search successful for '{dish_name}': {len(filtered_images)} images")
+        return filtered_images[:max_results]
+    
     def _perform_search(self, dish_name: str, max_results: int) -> List[Dict[str, Any]]:
         """
         Perform the actual Google Custom Search API request.
@@ -149,11 +246,22 @@ class ImageSearchService:
         # Enforce rate limiting
         self._enforce_rate_limit()
         
+        # Make the API request
+        response = self.session.get(
+            self.base_url,
+            params=self._build_search_params(dish_name, max_results),
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        
+        return self._parse_search_response(response.json(), dish_name)
+    
+    def _build_search_params(self, dish_name: str, max_results: int) -> Dict[str, Any]:
+        """Build the Google Custom Search query parameters for a dish."""
         # Prepare search query with food-specific terms
         search_query = f"{dish_name} dish"
         
-        # API parameters
-        params = {
+        return {
             'key': self.api_key,
             'cx': self.search_engine_id,
             'q': search_query,
@@ -165,21 +273,12 @@ class ImageSearchService:
             'fileType': 'jpg,png,webp',  # Preferred formats
             'rights': 'cc_publicdomain,cc_attribute,cc_sharealike'  # Prefer open licenses
         }
-        
-        # Make the API request
-        response = self.session.get(
-            self.base_url,
-            params=params,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        
+    
+    def _parse_search_response(self, data: Dict[str, Any], dish_name: str) -> List[Dict[str, Any]]:
+        """Extract raw image items from a decoded Custom Search response."""
         # Update quota tracking
         self.daily_quota_used += 1
         
-        # Parse response
-        data = response.json()
-        
         if 'error' in data:
             error_msg = data['error'].get('message', 'Unknown API error')
             raise Exception(f"Google Custom Search API error: {error_msg}")
@@ -242,13 +341,17 @@ class ImageSearchService:
                 logger.debug(f"Skipping invalid image result: {str(e)}")
                 continue
         
-        # Sort by quality score (larger images first, then by source reliability)
-        validated_images.sort(key=self._calculate_quality_score, reverse=True)
+        # Sort by quality score (larger images first, then by source reliability).
+        # Every image is kept because the full ranking is cached for later calls
+        # with larger max_results, so score once and reuse it for logging.
+        scored_images = [(self._calculate_quality_score(img), img) for img in validated_images]
+        scored_images.sort(key=itemgetter(0), reverse=True)
+        validated_images = [img for _, img in scored_images]
         
         # Log final filtered results
         logger.info(f"Filtered to {len(validated_images)} quality images:")
-        for i, img in enumerate(validated_images, 1):
-            logger.info(f"  {i}. {img.title} - {img.url} (Score: {self._calculate_quality_score(img):.3f})")
+        for i, (score, img) in enumerate(scored_images, 1):
+            logger.info(f"  {i}. {img.title} - {img.url} (Score: {score:.3f})")
         
         logger.debug(f"Filtered to {len(validated_images)} quality images")
         return validated_images
@@ -271,12 +374,8 @@ class ImageSearchService:
             return False
         
         # Very lenient filtering - accept almost all images
-        # Only filter out obvious logos
-        title_lower = title.lower() if title else ""
-        url_lower = url.lower()
-        
-        # Only reject obvious non-food content
-        if 'logo' in title_lower:
+        # Only reject obvious non-food content such as logos
+        if title and _REJECTED_TITLE_RE.search(title):
             return False
         
         return True
@@ -353,18 +452,6 @@ class ImageSearchService:
         
         return True
     
-    def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-    
     def validate_api_credentials(self) -> bool:
         """
         Validate that the API credentials are working.
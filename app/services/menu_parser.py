@@ -336,20 +336,29 @@ class MenuParser:
                 'confidence_distribution': {}
             }
         
-        dishes_with_prices = sum(1 for dish in dishes if dish.price)
-        dishes_with_descriptions = sum(1 for dish in dishes if dish.description)
-        average_confidence = sum(dish.confidence for dish in dishes) / len(dishes)
-        
-        # Confidence distribution
+        # Gather every statistic in a single pass over the dishes
+        dishes_with_prices = 0
+        dishes_with_descriptions = 0
+        total_confidence = 0.0
         confidence_ranges = {'low': 0, 'medium': 0, 'high': 0}
         for dish in dishes:
-            if dish.confidence < 0.5:
+            confidence = dish.confidence
+            total_confidence += confidence
+            if dish.price:
+                dishes_with_prices += 1
+            if dish.description:
+                dishes_with_descriptions += 1
+            
+            # Confidence distribution
+            if confidence < 0.5:
                 confidence_ranges['low'] += 1
-            elif dish.confidence < 0.8:
+            elif confidence < 0.8:
                 confidence_ranges['medium'] += 1
             else:
                 confidence_ranges['high'] += 1
         
+        average_confidence = total_confidence / len(dishes)
+        
         return {
             'total_dishes': len(dishes),
             'dishes_with_prices': dishes_with_prices,
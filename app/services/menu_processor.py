@@ -17,9 +17,9 @@ import threading
 from app.models.data_models import (
     MenuAnalysisResult, EnrichedDish, Dish, ProcessingState, ProcessingStep,
     ProcessingError, ErrorType, OCRResult, ParsedDish, FoodImage, DishDescription,
-    RequestCache
+    RequestCache, ServiceStatus
 )
-from app.services.secure_api_client import SecureAPIClient, APIProvider
+from app.services.secure_api_client import SecureAPIClient, APIProvider, get_client
 from app.services.ocr_service import OCRService
 from app.services.google_vision_ocr_service import GoogleVisionOCRService
 from app.services.menu_parser import MenuParser
@@ -48,7 +48,7 @@ class MenuProcessor:
             api_client: Secure API client for external service communication
             cache: Optional shared cache instance
         """
-        self.api_client = api_client or SecureAPIClient()
+        self.api_client = api_client or get_client()
         self.cache = cache or RequestCache()
         self.logger = logging.getLogger(__name__)
         
@@ -232,6 +232,41 @@ class MenuProcessor:
                 self.processing_states.pop(processing_id, None)
                 self.progress_callbacks.pop(processing_id, None)
     
+    def process_menu_batch(self, images: List[bytes],
+                           max_workers: Optional[int] = None) -> List[MenuAnalysisResult]:
+        """
+        Process several menu images concurrently.
+        
+        Each pipeline spends most of its time waiting on OCR and enrichment
+        APIs, so running them on a thread pool that shares this processor's
+        services and pooled sessions overlaps those waits. Because every
+        worker runs the whole OCR -> parse -> enrich sequence, one menu's
+        parsing proceeds while others are still in OCR, giving the same
+        overlap as a staged producer/consumer pipeline without a hand-off queue.
+        
+        Args:
+            images: Raw bytes of each menu image
+            max_workers: Maximum menus processed at once (defaults to 2 per CPU, capped at 8)
+            
+        Returns:
+            MenuAnalysisResult for each image, in input order
+        """
+        if not images:
+            return []
+        
+        workers = max_workers or min(8, (os.cpu_count() or 1) * 2)
+        # Index-suffixed IDs keep duplicate images from sharing a processing state
+        processing_ids = [
+            f"{hashlib.md5(image_data).hexdigest()[:12]}{index:04d}"
+            for index, image_data in enumerate(images)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(images))) as executor:
+            return list(executor.map(
+                lambda args: self.process_menu(args[0], processing_id=args[1]),
+                zip(images, processing_ids)
+            ))
+    
     def _validate_image_security(self, image_data: bytes) -> bool:
         """
         Validate image data for security concerns.
@@ -465,17 +500,20 @@ class MenuProcessor:
             progress: Progress percentage (0-100)
         """
         with self.state_lock:
-            if processing_id in self.processing_states:
-                state = self.processing_states[processing_id]
-                state.current_step = step
-                state.progress = progress
-                
-                # Notify progress callback if registered
-                if processing_id in self.progress_callbacks:
-                    try:
-                        self.progress_callbacks[processing_id](state)
-                    except Exception as e:
-                        self.logger.error(f"Progress callback failed: {str(e)}")
+            state = self.processing_states.get(processing_id)
+            if state is None:
+                return
+            state.current_step = step
+            state.progress = progress
+            callback = self.progress_callbacks.get(processing_id)
+        
+        # Notify the progress callback outside the lock so slow callbacks
+        # (logging, printing) never stall other threads' progress updates
+        if callback is not None:
+            try:
+                callback(state)
+            except Exception as e:
+                self.logger.error(f"Progress callback failed: {str(e)}")
     
     def _add_error(self, processing_id: str, error: ProcessingError) -> None:
         """
@@ -554,6 +592,28 @@ class MenuProcessor:
         return False
     
     
+    def get_service_summary(self) -> List[ServiceStatus]:
+        """
+        Get the availability of each external service.
+        
+        Returns:
+            One ServiceStatus per service, in pipeline order
+        """
+        provider_status = self.api_client.get_provider_status()
+        
+        def configured(provider: APIProvider) -> bool:
+            return provider_status.get(provider.value, {}).get('configured', False)
+        
+        return [
+            ServiceStatus('ocr_service', bool(self.ocr_service),
+                          configured(APIProvider.GOOGLE_VISION)),
+            ServiceStatus('image_search_service', bool(self.image_search_service),
+                          configured(APIProvider.GOOGLE_SEARCH)),
+            ServiceStatus('description_service',
+                          self.description_service.is_available() if self.description_service else False,
+                          configured(APIProvider.OPENAI)),
+        ]
+    
     def get_service_status(self) -> Dict[str, Any]:
         """
         Get status information about all services with security information.
@@ -561,29 +621,24 @@ class MenuProcessor:
         Returns:
             Dictionary with service status information
         """
-        # Get API client status
-        provider_status = self.api_client.get_provider_status()
         security_info = self.api_client.get_security_info()
+        ocr, image_search, description = self.get_service_summary()
         
         status = {
             'ocr_service': {
-                'available': bool(self.ocr_service),
+                'available': ocr.available,
                 'type': type(self.ocr_service).__name__ if self.ocr_service else None,
-                'api_configured': APIProvider.GOOGLE_VISION.value in provider_status and 
-                               provider_status[APIProvider.GOOGLE_VISION.value]['configured']
+                'api_configured': ocr.api_configured
             },
             'image_search_service': {
-                'available': bool(self.image_search_service),
-                'api_configured': APIProvider.GOOGLE_SEARCH.value in provider_status and 
-                               provider_status[APIProvider.GOOGLE_SEARCH.value]['configured'],
+                'available': image_search.available,
+                'api_configured': image_search.api_configured,
                 'statistics': self.image_search_service.get_search_statistics() 
                             if self.image_search_service else None
             },
             'description_service': {
-                'available': self.description_service.is_available() 
-                           if self.description_service else False,
-                'api_configured': APIProvider.OPENAI.value in provider_status and 
-                               provider_status[APIProvider.OPENAI.value]['configured'],
+                'available': description.available,
+                'api_configured': description.api_configured,
                 'info': self.description_service.get_service_info() 
                        if self.description_service else None
             },
@@ -4,19 +4,79 @@ Results Service for Menu Image Analyzer
 This module handles the display and formatting of menu analysis results.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import Counter
+import dataclasses
+from enum import Enum
+from functools import lru_cache
+import json
+import sys
+from typing import List, Dict, Any, Optional, Tuple, Final
 from app.models.data_models import EnrichedDish, ProcessingError, FoodImage, DishDescription
 import logging
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Inline SVG "No image available" placeholder, shared by every formatted image that falls back to it
+_PLACEHOLDER_IMAGE_URL: Final[str] = sys.intern("data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMzAwIiBoZWlnaHQ9IjIwMCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KICA8cmVjdCB3aWR0aD0iMzAwIiBoZWlnaHQ9IjIwMCIgZmlsbD0iI2Y4ZjlmYSIvPgogIDx0ZXh0IHg9IjE1MCIgeT0iMTAwIiBmb250LWZhbWlseT0iQXJpYWwsIHNhbnMtc2VyaWYiIGZvbnQtc2l6ZT0iMTQiIGZpbGw9IiM2Yzc1N2QiIHRleHQtYW5jaG9yPSJtaWRkbGUiIGR5PSIuM2VtIj5ObyBpbWFnZSBhdmFpbGFibGU8L3RleHQ+Cjwvc3ZnPgo=")
+
+
+def _format_image_dict(image: Dict[str, Any], default_url: str) -> Dict[str, Any]:
+    """Format an image given as a plain dictionary."""
+    url = image.get('url', default_url)
+    return {
+        'url': url,
+        'thumbnail_url': image.get('thumbnail_url', url),
+        'title': image.get('title', ''),
+        'load_status': image.get('load_status', 'loading')
+    }
+
+
+def _format_food_image(image: FoodImage, default_url: str) -> Dict[str, Any]:
+    """Format an image given as a FoodImage model."""
+    return {
+        'url': image.url,
+        'thumbnail_url': image.thumbnail_url or image.url,
+        'title': image.title,
+        'load_status': image.load_status
+    }
+
+
+def _error_type_key(error_type: Any) -> str:
+    """Return the display key for an error type, which may be an ErrorType or a plain string."""
+    return error_type.value if isinstance(error_type, Enum) else str(error_type)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the model types that the JSON encoders do not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Image formatters keyed on exact type: one dict lookup instead of isinstance chains
+_IMAGE_FORMATTERS = {
+    dict: _format_image_dict,
+    FoodImage: _format_food_image,
+}
+
 
 class ResultsService:
     """Service for handling results display and formatting."""
     
-    def __init__(self):
-        """Initialize the results service."""
-        self.placeholder_image_url = "data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMzAwIiBoZWlnaHQ9IjIwMCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KICA8cmVjdCB3aWR0aD0iMzAwIiBoZWlnaHQ9IjIwMCIgZmlsbD0iI2Y4ZjlmYSIvPgogIDx0ZXh0IHg9IjE1MCIgeT0iMTAwIiBmb250LWZhbWlseT0iQXJpYWwsIHNhbnMtc2VyaWYiIGZvbnQtc2l6ZT0iMTQiIGZpbGw9IiM2Yzc1N2QiIHRleHQtYW5jaG9yPSJtaWRkbGUiIGR5PSIuM2VtIj5ObyBpbWFnZSBhdmFpbGFibGU8L3RleHQ+Cjwvc3ZnPgo="
+    @property
+    def placeholder_image_url(self) -> str:
+        """Data URL of the placeholder shown when a dish has no image."""
+        return _PLACEHOLDER_IMAGE_URL
     
     def format_results_for_display(self, dishes: List[EnrichedDish], 
                                   processing_errors: List[ProcessingError] = None) -> Dict[str, Any]:
@@ -31,11 +91,9 @@ class ResultsService:
             Dictionary containing formatted results data
         """
         try:
-            formatted_dishes = []
-            
-            for enriched_dish in dishes:
-                formatted_dish = self._format_single_dish(enriched_dish)
-                formatted_dishes.append(formatted_dish)
+            # Single pass over the dishes; bind the formatter once outside the loop
+            format_dish = self._format_single_dish
+            formatted_dishes = [format_dish(enriched_dish) for enriched_dish in dishes]
             
             return {
                 'dishes': formatted_dishes,
@@ -59,6 +117,33 @@ class ResultsService:
                 'success': False
             }
     
+    def format_results_as_json(self, dishes: List[EnrichedDish],
+                               processing_errors: List[ProcessingError] = None) -> bytes:
+        """
+        Serialize enriched dishes straight to JSON for API consumers.
+        
+        Unlike format_results_for_display, this skips the per-dish display
+        formatting and encodes the models directly.
+        
+        Args:
+            dishes: List of enriched dishes to serialize
+            processing_errors: Optional list of processing errors
+            
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        payload = {
+            'dishes': dishes,
+            'total_count': len(dishes),
+            'errors': processing_errors or [],
+            'has_errors': bool(processing_errors),
+            'success': len(dishes) > 0
+        }
+        
+        if orjson is not None:
+            return orjson.dumps(payload, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload, default=_json_default, separators=(',', ':')).encode('utf-8')
+    
     def _format_single_dish(self, enriched_dish: EnrichedDish) -> Dict[str, Any]:
         """
         Format a single enriched dish for display.
@@ -112,44 +197,21 @@ class ResultsService:
         }
         
         # Handle primary image
-        if images.get('primary'):
-            primary = images['primary']
-            if isinstance(primary, dict):
-                formatted['primary'] = {
-                    'url': primary.get('url', self.placeholder_image_url),
-                    'thumbnail_url': primary.get('thumbnail_url', primary.get('url', self.placeholder_image_url)),
-                    'title': primary.get('title', ''),
-                    'load_status': primary.get('load_status', 'loading')
-                }
-                formatted['has_images'] = True
-            elif isinstance(primary, FoodImage):
-                formatted['primary'] = {
-                    'url': primary.url,
-                    'thumbnail_url': primary.thumbnail_url or primary.url,
-                    'title': primary.title,
-                    'load_status': primary.load_status
-                }
+        primary = images.get('primary')
+        if primary:
+            format_image = _IMAGE_FORMATTERS.get(type(primary))
+            if format_image:
+                formatted['primary'] = format_image(primary, _PLACEHOLDER_IMAGE_URL)
                 formatted['has_images'] = True
         
         # Handle secondary images
-        if images.get('secondary'):
-            secondary_images = images['secondary']
-            if isinstance(secondary_images, list):
-                for img in secondary_images:
-                    if isinstance(img, dict):
-                        formatted['secondary'].append({
-                            'url': img.get('url', ''),
-                            'thumbnail_url': img.get('thumbnail_url', img.get('url', '')),
-                            'title': img.get('title', ''),
-                            'load_status': img.get('load_status', 'loading')
-                        })
-                    elif isinstance(img, FoodImage):
-                        formatted['secondary'].append({
-                            'url': img.url,
-                            'thumbnail_url': img.thumbnail_url or img.url,
-                            'title': img.title,
-                            'load_status': img.load_status
-                        })
+        secondary_images = images.get('secondary')
+        if secondary_images and isinstance(secondary_images, list):
+            formatted['secondary'] = [
+                _IMAGE_FORMATTERS[type(img)](img, '')
+                for img in secondary_images
+                if type(img) in _IMAGE_FORMATTERS
+            ]
         
         return formatted
     
@@ -190,21 +252,29 @@ class ResultsService:
         Returns:
             Formatted price dictionary
         """
+        display, original, has_price, formatted = self._format_price_cached(price)
+        return {
+            'display': display,
+            'original': original,
+            'has_price': has_price,
+            'formatted': formatted
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_price_cached(price: Optional[str]) -> Tuple[str, str, bool, str]:
+        """
+        Compute the price display fields once per distinct price string.
+        
+        Menus repeat a handful of price points across many dishes, so the
+        immutable result tuple is memoized and only the dict is built per call.
+        """
         if not price or price.strip() == '':
-            return {
-                'display': 'Price not available',
-                'original': '',
-                'has_price': False,
-                'formatted': 'N/A'
-            }
+            return ('Price not available', '', False, 'N/A')
         
         # Preserve original formatting
-        return {
-            'display': price.strip(),
-            'original': price,
-            'has_price': True,
-            'formatted': price.strip()
-        }
+        stripped = price.strip()
+        return (stripped, price, True, stripped)
     
     def create_error_summary(self, errors: List[ProcessingError]) -> Dict[str, Any]:
         """
@@ -225,14 +295,8 @@ class ResultsService:
                 'recoverable_count': 0
             }
         
-        error_counts = {}
-        recoverable_count = 0
-        
-        for error in errors:
-            error_type = error.type.value if hasattr(error.type, 'value') else str(error.type)
-            error_counts[error_type] = error_counts.get(error_type, 0) + 1
-            if error.recoverable:
-                recoverable_count += 1
+        error_counts = Counter(_error_type_key(error.type) for error in errors)
+        recoverable_count = sum(1 for error in errors if error.recoverable)
         
         summary_parts = []
         for error_type, count in error_counts.items():
@@ -6,25 +6,71 @@ with proper authentication, rate limiting, error handling, and security measures
 """
 
 import os
+import re
 import time
 import logging
-import hashlib
-import hmac
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass
+import math
+import queue
+import secrets
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Deque, Tuple, Mapping
+from dataclasses import dataclass, field
 from enum import Enum
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.exceptions import InsecureRequestWarning
 import urllib3
 
+try:
+    import redis
+except ImportError:  # Optional: shared rate limiting across worker processes
+    redis = None
+
 # Disable insecure request warnings (only in development)
 if os.environ.get('ENVIRONMENT', 'production') == 'development':
     urllib3.disable_warnings(InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Sliding windows tracked per provider: last second, last minute, last hour
+_RATE_WINDOWS = (1.0, 60.0, 3600.0)
+
+# Redacts API keys passed as query parameters before URLs are logged
+_KEY_RE = re.compile(r'(key=)[^&]+')
+
+# Atomically trims a provider's sorted set to the last window and records this
+# request only if it fits under the limit. Returns "0" when admitted, otherwise
+# the seconds until the oldest entry expires (as a string, since Redis would
+# truncate a Lua float reply to an integer). Rejected attempts are not recorded.
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('EXPIRE', key, math.ceil(window))
+    return '0'
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return tostring(tonumber(oldest[2]) + window - now)
+"""
+
+# Floor on the wait between shared rate-limit retries, so callers never spin
+_MIN_RATE_LIMIT_WAIT = 0.01
+
+# How long get_provider_status() may serve a memoised snapshot
+_STATUS_CACHE_TTL = 1.0
+
 
 class APIProvider(Enum):
     """Supported API providers."""
@@ -39,6 +85,7 @@ class APICredentials:
     provider: APIProvider
     api_key: str
     additional_params: Dict[str, str] = None
+    _masked_key: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate credentials after initialization."""
@@ -47,15 +94,19 @@ class APICredentials:
         
         if self.additional_params is None:
             self.additional_params = {}
+        
+        # Keys never change after creation, so mask once
+        if len(self.api_key) <= 8:
+            self._masked_key = "*" * len(self.api_key)
+        else:
+            self._masked_key = self.api_key[:4] + "*" * (len(self.api_key) - 8) + self.api_key[-4:]
     
     def get_masked_key(self) -> str:
         """Get masked version of API key for logging."""
-        if len(self.api_key) <= 8:
-            return "*" * len(self.api_key)
-        return self.api_key[:4] + "*" * (len(self.api_key) - 8) + self.api_key[-4:]
+        return self._masked_key
 
 
-@dataclass
+@dataclass(frozen=True)
 class RateLimitConfig:
     """Rate limiting configuration."""
     requests_per_second: float = 1.0
@@ -64,6 +115,86 @@ class RateLimitConfig:
     requests_per_day: int = 10000
     backoff_factor: float = 1.0
     max_retries: int = 3
+    capacity: Optional[float] = None
+    
+    def __post_init__(self):
+        """Default the burst capacity to one second's worth of requests."""
+        if self.capacity is None:
+            object.__setattr__(self, 'capacity', max(1.0, self.requests_per_second))
+    
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added to the bucket per second."""
+        return self.requests_per_second
+
+
+def _refill_permits(permits: Mapping[APIProvider, queue.Queue],
+                    rates: Mapping[APIProvider, float],
+                    stop: threading.Event) -> None:
+    """
+    Top up each provider's permit queue at its refill rate until stopped.
+    
+    Runs on a daemon thread; full queues simply drop the extra permits.
+    """
+    tick = min(1.0 / rate for rate in rates.values())
+    credit = dict.fromkeys(permits, 0.0)
+    last_refill = time.monotonic()
+    
+    while not stop.wait(tick):
+        now = time.monotonic()
+        elapsed, last_refill = now - last_refill, now
+        
+        for provider, permit_queue in permits.items():
+            credit[provider] += elapsed * rates[provider]
+            while credit[provider] >= 1.0:
+                credit[provider] -= 1.0
+                try:
+                    permit_queue.put_nowait(None)
+                except queue.Full:
+                    credit[provider] = 0.0
+                    break
+
+
+_DEFAULT_RATE_LIMITS: Mapping[APIProvider, RateLimitConfig] = MappingProxyType({
+    APIProvider.GOOGLE_VISION: RateLimitConfig(
+        requests_per_second=10.0,
+        requests_per_minute=600,
+        requests_per_hour=1000,
+        requests_per_day=1000
+    ),
+    APIProvider.GOOGLE_SEARCH: RateLimitConfig(
+        requests_per_second=1.0,
+        requests_per_minute=10,
+        requests_per_hour=100,
+        requests_per_day=100  # Free tier limit
+    ),
+    APIProvider.OPENAI: RateLimitConfig(
+        requests_per_second=3.0,
+        requests_per_minute=60,
+        requests_per_hour=1000,
+        requests_per_day=10000
+    )
+})
+
+
+# Provider-specific diagnostics for failed responses: (provider, status) -> (level, message)
+_ERROR_MESSAGES: Mapping[Tuple[APIProvider, int], Tuple[int, str]] = MappingProxyType({
+    (APIProvider.GOOGLE_VISION, 403): (logging.ERROR, "Google Vision API quota exceeded or invalid credentials"),
+    (APIProvider.GOOGLE_SEARCH, 403): (logging.ERROR, "Google Search API quota exceeded or invalid credentials"),
+    (APIProvider.OPENAI, 429): (logging.WARNING, "OpenAI API rate limit hit")
+})
+
+
+@cache
+def _read_env() -> Mapping[str, Optional[str]]:
+    """Read API credential environment variables once per process."""
+    return MappingProxyType({
+        'ocr_key': os.environ.get('OCR_API_KEY') or os.environ.get('GOOGLE_VISION_API_KEY'),
+        'search_key': os.environ.get('GOOGLE_SEARCH_API_KEY'),
+        'search_engine_id': os.environ.get('GOOGLE_SEARCH_ENGINE_ID'),
+        'openai_key': os.environ.get('OPENAI_API_KEY'),
+        'redis_url': os.environ.get('REDIS_URL')
+    })
 
 
 class SecureAPIClient:
@@ -72,19 +203,33 @@ class SecureAPIClient:
     
     This client provides a secure way to interact with external APIs while
     protecting sensitive credentials and implementing proper security measures.
+    
+    Use get_client() to obtain the process-wide instance; its ``session`` is
+    shared across threads (urllib3's connection pool is thread-safe), so
+    callers reuse warm connections instead of paying TCP/TLS setup each time.
     """
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, redis_url: Optional[str] = None):
         """
         Initialize the secure API client.
         
         Args:
             timeout: Default request timeout in seconds
+            redis_url: Optional Redis URL (defaults to REDIS_URL) used to share
+                rate limits between worker processes
         """
         self.timeout = timeout
         self.credentials: Dict[APIProvider, APICredentials] = {}
         self.rate_limits: Dict[APIProvider, RateLimitConfig] = {}
-        self.request_history: Dict[APIProvider, List[float]] = {}
+        self.request_history: Dict[APIProvider, Deque[float]] = {}
+        self._request_windows: Dict[APIProvider, Tuple[Deque[float], ...]] = {}
+        # The client is shared by worker threads; guards every window read and mutation
+        self._history_lock = threading.Lock()
+        self._permits: Dict[APIProvider, queue.Queue] = {}
+        self._refiller: Optional[threading.Thread] = None
+        self._refiller_lock = threading.Lock()
+        self._auth_headers: Dict[APIProvider, Dict[str, str]] = {}
+        self._status_cache: Tuple[float, Dict[str, Dict[str, Any]]] = (0.0, {})
         
         # Configure HTTP session with security settings
         self.session = requests.Session()
@@ -93,6 +238,9 @@ class SecureAPIClient:
         # Load credentials from environment
         self._load_credentials()
         
+        # Shared sliding window in Redis when available, in-process permits otherwise
+        self._redis_window = self._configure_redis(redis_url or _read_env()['redis_url'])
+        
         logger.info("Secure API client initialized")
     
     def _configure_session(self) -> None:
@@ -105,7 +253,13 @@ class SecureAPIClient:
             allowed_methods=["HEAD", "GET", "POST"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger per-host pools so concurrent workers reuse warm TLS sockets
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=64,
+            pool_block=False
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -113,23 +267,48 @@ class SecureAPIClient:
         self.session.headers.update({
             'User-Agent': 'MenuImageAnalyzer/1.0',
             'Accept': 'application/json',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
+            # urllib3 only lists br/zstd when a decoder is installed
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive',
+            'Keep-Alive': 'timeout=600, max=1000'
         })
         
         # SSL verification (enabled by default for production)
         self.session.verify = os.environ.get('SSL_VERIFY', 'true').lower() == 'true'
     
+    def _configure_redis(self, redis_url: Optional[str]) -> Optional[Callable]:
+        """
+        Prepare the Redis sliding-window script if Redis is configured.
+        
+        Args:
+            redis_url: Redis connection URL
+            
+        Returns:
+            Registered Lua script, or None to use in-process rate limiting
+        """
+        if not redis_url or not redis_url.startswith(('redis://', 'rediss://', 'unix://')):
+            return None
+        
+        if redis is None:
+            logger.warning("REDIS_URL is set but the redis package is not installed; "
+                           "rate limits will not be shared between workers")
+            return None
+        
+        client = redis.Redis.from_url(redis_url, socket_timeout=self.timeout)
+        return client.register_script(_SLIDING_WINDOW_LUA)
+    
     def _load_credentials(self) -> None:
         """Load API credentials from environment variables."""
+        env = _read_env()
+        
         # Google Vision OCR
-        ocr_key = os.environ.get('OCR_API_KEY') or os.environ.get('GOOGLE_VISION_API_KEY')
+        ocr_key = env['ocr_key']
         if ocr_key:
             self.add_credentials(APIProvider.GOOGLE_VISION, ocr_key)
         
         # Google Custom Search
-        search_key = os.environ.get('GOOGLE_SEARCH_API_KEY')
-        search_engine_id = os.environ.get('GOOGLE_SEARCH_ENGINE_ID')
+        search_key = env['search_key']
+        search_engine_id = env['search_engine_id']
         if search_key and search_engine_id:
             self.add_credentials(
                 APIProvider.GOOGLE_SEARCH, 
@@ -138,7 +317,7 @@ class SecureAPIClient:
             )
         
         # OpenAI
-        openai_key = os.environ.get('OPENAI_API_KEY')
+        openai_key = env['openai_key']
         if openai_key:
             self.add_credentials(APIProvider.OPENAI, openai_key)
         
@@ -147,27 +326,39 @@ class SecureAPIClient:
     
     def _set_default_rate_limits(self) -> None:
         """Set default rate limiting configurations for each provider."""
-        self.rate_limits = {
-            APIProvider.GOOGLE_VISION: RateLimitConfig(
-                requests_per_second=10.0,
-                requests_per_minute=600,
-                requests_per_hour=1000,
-                requests_per_day=1000
-            ),
-            APIProvider.GOOGLE_SEARCH: RateLimitConfig(
-                requests_per_second=1.0,
-                requests_per_minute=10,
-                requests_per_hour=100,
-                requests_per_day=100  # Free tier limit
-            ),
-            APIProvider.OPENAI: RateLimitConfig(
-                requests_per_second=3.0,
-                requests_per_minute=60,
-                requests_per_hour=1000,
-                requests_per_day=10000
-            )
+        self.rate_limits = dict(_DEFAULT_RATE_LIMITS)
+        self._permits = {
+            provider: self._full_permit_queue(config)
+            for provider, config in self.rate_limits.items()
         }
     
+    @staticmethod
+    def _full_permit_queue(config: RateLimitConfig) -> queue.Queue:
+        """Create a permit queue holding a full burst's worth of permits."""
+        capacity = math.ceil(config.capacity)
+        permit_queue = queue.Queue(maxsize=capacity)
+        for _ in range(capacity):
+            permit_queue.put_nowait(None)
+        return permit_queue
+    
+    def _start_refiller(self) -> None:
+        """Start the background thread that refills permit queues."""
+        with self._refiller_lock:
+            if self._refiller is not None:
+                return
+            
+            stop = threading.Event()
+            rates = {provider: config.refill_rate for provider, config in self.rate_limits.items()}
+            self._refiller = threading.Thread(
+                target=_refill_permits,
+                args=(self._permits, rates, stop),
+                name="api-permit-refiller",
+                daemon=True
+            )
+            # The thread never references the client, so it stops once the client is collected
+            weakref.finalize(self, stop.set)
+            self._refiller.start()
+    
     def add_credentials(self, provider: APIProvider, api_key: str, 
                        additional_params: Dict[str, str] = None) -> None:
         """
@@ -181,7 +372,9 @@ class SecureAPIClient:
         try:
             credentials = APICredentials(provider, api_key, additional_params)
             self.credentials[provider] = credentials
-            self.request_history[provider] = []
+            self._auth_headers[provider] = self._build_auth_headers(provider, credentials)
+            self._reset_request_windows(provider)
+            self._status_cache = (0.0, {})
             
             logger.info(f"Added credentials for {provider.value}: {credentials.get_masked_key()}")
             
@@ -232,17 +425,18 @@ class SecureAPIClient:
         self._enforce_rate_limit(provider)
         
         # Prepare headers with authentication
-        request_headers = headers or {}
         if auth_callback:
-            request_headers = auth_callback(request_headers, self.credentials[provider])
+            request_headers = auth_callback(headers or {}, self.credentials[provider])
+            request_headers.update({
+                'X-Request-ID': self._generate_request_id(),
+                'X-Client-Version': '1.0'
+            })
         else:
-            request_headers = self._add_authentication(provider, request_headers)
-        
-        # Add security headers
-        request_headers.update({
-            'X-Request-ID': self._generate_request_id(),
-            'X-Client-Version': '1.0'
-        })
+            # Case-insensitive so provider auth reliably overrides caller spellings
+            request_headers = CaseInsensitiveDict(headers)
+            request_headers.update(self._auth_headers[provider])
+            request_headers['X-Request-ID'] = self._generate_request_id()
+            request_headers['X-Client-Version'] = '1.0'
         
         try:
             # Make the request
@@ -272,70 +466,156 @@ class SecureAPIClient:
             logger.error(f"API request failed for {provider.value}: {e}")
             raise
     
-    def _add_authentication(self, provider: APIProvider, headers: Dict[str, str]) -> Dict[str, str]:
+    @staticmethod
+    def _build_auth_headers(provider: APIProvider, credentials: APICredentials) -> Dict[str, str]:
         """
-        Add authentication to request headers.
+        Build the authentication headers for a provider.
+        
+        Called once when credentials are added so requests only merge a
+        ready-made dict.
         
         Args:
             provider: API provider
-            headers: Existing headers
+            credentials: Provider credentials
             
         Returns:
-            Headers with authentication added
+            Headers carrying the provider's authentication
         """
-        credentials = self.credentials[provider]
-        
         if provider == APIProvider.GOOGLE_VISION:
             # Google Vision uses API key in URL or Authorization header
-            headers['Authorization'] = f'Bearer {credentials.api_key}'
-            
-        elif provider == APIProvider.GOOGLE_SEARCH:
-            # Google Search uses API key as parameter (handled in URL)
-            pass
-            
-        elif provider == APIProvider.OPENAI:
+            return {'Authorization': f'Bearer {credentials.api_key}'}
+        
+        if provider == APIProvider.OPENAI:
             # OpenAI uses Bearer token
-            headers['Authorization'] = f'Bearer {credentials.api_key}'
-            headers['Content-Type'] = 'application/json'
+            return {
+                'Authorization': f'Bearer {credentials.api_key}',
+                'Content-Type': 'application/json'
+            }
         
-        return headers
+        # Google Search uses API key as parameter (handled in URL)
+        return {}
     
     def _enforce_rate_limit(self, provider: APIProvider) -> None:
         """
         Enforce rate limiting for API requests.
         
+        With Redis configured all workers share a per-minute sliding window.
+        Otherwise bursts up to the bucket capacity go through immediately and
+        later callers block on the provider's permit queue, which a
+        background thread refills at the configured rate.
+        
         Args:
             provider: API provider
+            
+        Raises:
+            requests.exceptions.Timeout: If no permit arrives within the timeout
         """
-        if provider not in self.rate_limits:
+        if self._redis_window is not None and provider in self.rate_limits:
+            try:
+                self._enforce_shared_rate_limit(provider)
+                return
+            except redis.RedisError as e:
+                logger.warning(f"Shared rate limiting unavailable for {provider.value}, "
+                               f"using local limits: {e}")
+        
+        permit_queue = self._permits.get(provider)
+        if permit_queue is None:
             return
         
-        rate_config = self.rate_limits[provider]
-        current_time = time.time()
+        if self._refiller is None:
+            self._start_refiller()
         
-        # Clean old requests from history
-        history = self.request_history.get(provider, [])
-        history = [t for t in history if current_time - t < 3600]  # Keep last hour
-        self.request_history[provider] = history
+        try:
+            permit_queue.get_nowait()
+        except queue.Empty:
+            logger.debug(f"Rate limiting {provider.value}: waiting for permit")
+            try:
+                permit_queue.get(timeout=self.timeout)
+            except queue.Empty:
+                raise requests.exceptions.Timeout(
+                    f"Timed out waiting for a rate limit permit for {provider.value}"
+                ) from None
+    
+    def _enforce_shared_rate_limit(self, provider: APIProvider) -> None:
+        """
+        Enforce the per-minute limit through the Redis sliding window.
         
-        # Check rate limits
-        recent_requests = [t for t in history if current_time - t < 1.0]  # Last second
-        if len(recent_requests) >= rate_config.requests_per_second:
-            sleep_time = 1.0 / rate_config.requests_per_second
+        The script only records a request once it fits in the window, so
+        waiting callers retry until admitted instead of all proceeding when
+        the oldest entry expires.
+        
+        Args:
+            provider: API provider
+        """
+        key = f"menureader:ratelimit:{provider.value}"
+        limit = self.rate_limits[provider].requests_per_minute
+        member = self._generate_request_id()
+        
+        while True:
+            wait = float(self._redis_window(keys=[key], args=[time.time(), 60, limit, member]))
+            if wait <= 0:
+                return
+            
+            sleep_time = max(wait, _MIN_RATE_LIMIT_WAIT)
             logger.debug(f"Rate limiting {provider.value}: sleeping {sleep_time:.2f}s")
             time.sleep(sleep_time)
+    
+    def _reset_request_windows(self, provider: APIProvider) -> None:
+        """Start empty sliding windows for a provider."""
+        with self._history_lock:
+            self._new_request_windows(provider)
+    
+    def _new_request_windows(self, provider: APIProvider) -> Tuple[Deque[float], ...]:
+        """Install empty sliding windows for a provider; caller holds the history lock."""
+        windows = tuple(deque() for _ in _RATE_WINDOWS)
+        self._request_windows[provider] = windows
+        self.request_history[provider] = windows[-1]
+        return windows
+    
+    def _window_counts(self, provider: APIProvider, current_time: float) -> Tuple[int, ...]:
+        """
+        Expire old timestamps and count requests in each sliding window.
         
-        # Check minute limit
-        minute_requests = [t for t in history if current_time - t < 60]
-        if len(minute_requests) >= rate_config.requests_per_minute:
-            logger.warning(f"Approaching minute rate limit for {provider.value}")
+        Timestamps are appended in order, so expiry only ever pops from the
+        left and the cost is amortised O(1) per request.
+        
+        Args:
+            provider: API provider
+            current_time: Current timestamp
+            
+        Returns:
+            Request counts for the last second, minute and hour
+        """
+        with self._history_lock:
+            windows = self._request_windows.get(provider)
+            if windows is None:
+                return (0,) * len(_RATE_WINDOWS)
+            return self._expire_windows(windows, current_time)
+    
+    @staticmethod
+    def _expire_windows(windows: Tuple[Deque[float], ...], current_time: float) -> Tuple[int, ...]:
+        """Drop aged-out timestamps and return window sizes; caller holds the history lock."""
+        for span, window in zip(_RATE_WINDOWS, windows):
+            cutoff = current_time - span
+            while window and window[0] <= cutoff:
+                window.popleft()
+        
+        return tuple(len(window) for window in windows)
     
     def _update_request_history(self, provider: APIProvider) -> None:
         """Update request history for rate limiting."""
-        if provider not in self.request_history:
-            self.request_history[provider] = []
+        with self._history_lock:
+            # Stamp under the lock so each window stays in order for left-side expiry
+            current_time = time.time()
+            windows = self._request_windows.get(provider) or self._new_request_windows(provider)
+            for window in windows:
+                window.append(current_time)
+            counts = self._expire_windows(windows, current_time)
         
-        self.request_history[provider].append(time.time())
+        # Check minute limit
+        rate_config = self.rate_limits.get(provider)
+        if rate_config and counts[1] >= rate_config.requests_per_minute:
+            logger.warning(f"Approaching minute rate limit for {provider.value}")
     
     def _check_api_errors(self, provider: APIProvider, response: requests.Response) -> None:
         """
@@ -345,18 +625,17 @@ class SecureAPIClient:
             provider: API provider
             response: Response object
         """
-        if provider == APIProvider.GOOGLE_VISION and response.status_code == 403:
-            logger.error("Google Vision API quota exceeded or invalid credentials")
-            
-        elif provider == APIProvider.GOOGLE_SEARCH and response.status_code == 403:
-            logger.error("Google Search API quota exceeded or invalid credentials")
-            
-        elif provider == APIProvider.OPENAI and response.status_code == 429:
-            logger.warning("OpenAI API rate limit hit")
+        if response.status_code < 400:
+            return
+        
+        entry = _ERROR_MESSAGES.get((provider, response.status_code))
+        if entry:
+            level, message = entry
+            logger.log(level, message)
     
     def _generate_request_id(self) -> str:
         """Generate a unique request ID for tracking."""
-        return hashlib.md5(f"{time.time()}".encode()).hexdigest()[:16]
+        return secrets.token_hex(8)
     
     def _log_request(self, provider: APIProvider, method: str, url: str, status_code: int) -> None:
         """
@@ -368,10 +647,11 @@ class SecureAPIClient:
             url: Request URL (will be sanitized)
             status_code: Response status code
         """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
         # Sanitize URL to remove API keys
-        sanitized_url = url
-        if 'key=' in url:
-            sanitized_url = url.split('key=')[0] + 'key=***'
+        sanitized_url = _KEY_RE.sub(r'\1***', url)
         
         logger.debug(f"{provider.value} API: {method} {sanitized_url} -> {status_code}")
     
@@ -379,20 +659,27 @@ class SecureAPIClient:
         """
         Get status information for all configured providers.
         
+        The snapshot is memoised for a second so frequent health probes are
+        served from memory.
+        
         Returns:
             Dictionary with provider status information
         """
+        current_time = time.time()
+        expiry, cached_status = self._status_cache
+        if current_time < expiry:
+            return cached_status
+        
         status = {}
         
         for provider in APIProvider:
             if provider in self.credentials:
-                history = self.request_history.get(provider, [])
-                current_time = time.time()
+                _, minute_count, hour_count = self._window_counts(provider, current_time)
                 
                 # Count recent requests
                 recent_requests = {
-                    'last_minute': len([t for t in history if current_time - t < 60]),
-                    'last_hour': len([t for t in history if current_time - t < 3600])
+                    'last_minute': minute_count,
+                    'last_hour': hour_count
                 }
                 
                 status[provider.value] = {
@@ -410,32 +697,37 @@ class SecureAPIClient:
                     'error': 'No credentials configured'
                 }
         
+        self._status_cache = (current_time + _STATUS_CACHE_TTL, status)
         return status
     
     def validate_all_credentials(self) -> Dict[str, bool]:
         """
         Validate all configured API credentials by making test requests.
         
+        Providers are probed concurrently over the shared session, so the
+        total wait is the slowest round-trip rather than their sum.
+        
         Returns:
             Dictionary with validation results
         """
-        results = {}
-        
-        for provider in self.credentials:
-            try:
-                if provider == APIProvider.GOOGLE_VISION:
-                    # Test with minimal request
-                    results[provider.value] = self._test_google_vision()
-                elif provider == APIProvider.GOOGLE_SEARCH:
-                    results[provider.value] = self._test_google_search()
-                elif provider == APIProvider.OPENAI:
-                    results[provider.value] = self._test_openai()
-                else:
-                    results[provider.value] = False
-                    
-            except Exception as e:
-                logger.error(f"Credential validation failed for {provider.value}: {e}")
-                results[provider.value] = False
+        tests = {
+            APIProvider.GOOGLE_VISION: self._test_google_vision,
+            APIProvider.GOOGLE_SEARCH: self._test_google_search,
+            APIProvider.OPENAI: self._test_openai
+        }
+        results = {provider.value: False for provider in self.credentials}
+        providers = [provider for provider in self.credentials if provider in tests]
+        if not providers:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+            futures = {executor.submit(tests[provider]): provider for provider in providers}
+            for future in as_completed(futures):
+                provider = futures[future]
+                try:
+                    results[provider.value] = future.result()
+                except Exception as e:
+                    logger.error(f"Credential validation failed for {provider.value}: {e}")
         
         return results
     
@@ -485,7 +777,10 @@ class SecureAPIClient:
     
     def clear_request_history(self) -> None:
         """Clear request history for all providers."""
-        self.request_history.clear()
+        with self._history_lock:
+            self.request_history.clear()
+            self._request_windows.clear()
+        self._status_cache = (0.0, {})
         logger.info("Request history cleared")
     
     def get_security_info(self) -> Dict[str, Any]:
@@ -502,4 +797,23 @@ class SecureAPIClient:
             'rate_limiting_enabled': bool(self.rate_limits),
             'session_headers': {k: v for k, v in self.session.headers.items() 
                               if 'auth' not in k.lower() and 'key' not in k.lower()}
-        }
\ No newline at end of file
+        }
+
+
+_CLIENT: Optional[SecureAPIClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client() -> SecureAPIClient:
+    """
+    Get the shared SecureAPIClient, creating it on first use.
+    
+    Returns:
+        Process-wide SecureAPIClient instance
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = SecureAPIClient()
+    return _CLIENT
@@ -0,0 +1,149 @@
+"""
+Helpers shared by the external API service clients.
+
+Pooled HTTP sessions, request pacing, JSON encoding and image fingerprints
+live here so every service configures them the same way.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Union
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The image hash is only a cache key, so use the fastest available SIMD hash
+try:
+    from blake3 import blake3
+
+    def hash_image(data: bytes) -> str:
+        """Fingerprint image bytes for cache lookups using BLAKE3."""
+        return blake3(data).hexdigest(32)
+except ImportError:
+    try:
+        import xxhash
+
+        def hash_image(data: bytes) -> str:
+            """Fingerprint image bytes for cache lookups using XXH3-128."""
+            return xxhash.xxh3_128_hexdigest(data)
+    except ImportError:
+        def hash_image(data: bytes) -> str:
+            """Fingerprint image bytes for cache lookups using BLAKE2b-128."""
+            return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+logger = logging.getLogger(__name__)
+
+
+def dump_json(payload: Any) -> bytes:
+    """Serialize a request payload to JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def load_json(response: Any) -> Any:
+    """Decode a JSON response body, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def parse_json(text: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document held in memory, using orjson when it is available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    catching the stdlib exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@lru_cache(maxsize=None)
+def get_pooled_session(pool_connections: int = 10, pool_maxsize: int = 10,
+                       retry_post: bool = False) -> requests.Session:
+    """
+    Get a process-wide HTTP session with retries and connection pooling.
+
+    Services asking for the same pool settings share one session, so
+    connections to each API stay warm across service instances.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Connections kept open per host
+        retry_post: Also retry POSTs, but only when they were rate limited
+            (429) or never connected, since a POST that reached the
+            server may already have been processed (and billed)
+
+    Returns:
+        Shared requests session
+    """
+    session = requests.Session()
+    if retry_post:
+        retry_kwargs = {
+            'allowed_methods': ["HEAD", "GET", "POST"],
+            'status_forcelist': [429],
+            'read': 0
+        }
+    else:
+        retry_kwargs = {'status_forcelist': [429, 500, 502, 503, 504]}
+    retry_strategy = Retry(total=3, backoff_factor=1, **retry_kwargs)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+class RequestPacingMixin:
+    """
+    Space API requests at least ``min_request_interval`` seconds apart.
+
+    Classes using the mixin set ``min_request_interval`` and
+    ``last_request_time`` in their constructor.
+    """
+
+    min_request_interval: float
+    last_request_time: float
+
+    def _reserve_request_slot(self) -> float:
+        """
+        Claim the next request slot.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        current_time = time.time()
+        sleep_time = max(0.0, self.min_request_interval - (current_time - self.last_request_time))
+        self.last_request_time = current_time + sleep_time
+        return sleep_time
+
+    def _enforce_rate_limit(self) -> None:
+        """Enforce rate limiting between API requests."""
+        sleep_time = self._reserve_request_slot()
+        if sleep_time:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            time.sleep(sleep_time)
+
+    async def _enforce_rate_limit_async(self) -> None:
+        """Enforce rate limiting without blocking the event loop."""
+        sleep_time = self._reserve_request_slot()
+        if sleep_time:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
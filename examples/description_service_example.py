@@ -48,28 +48,24 @@ def main():
     
     print("Generating descriptions for example dishes...\n")
     
-    for i, dish in enumerate(example_dishes, 1):
+    try:
+        # One batch call fans the requests out in parallel instead of one at a time
+        descriptions = service.generate_batch_descriptions(example_dishes)
+    except Exception as e:
+        print(f"❌ Error generating descriptions: {e}")
+        descriptions = []
+    
+    for i, (dish, description) in enumerate(zip(example_dishes, descriptions), 1):
         print(f"--- Dish {i}: {dish['name']} ---")
         
-        try:
-            # Generate description
-            description = service.generate_description(
-                dish_name=dish['name'],
-                price=dish['price']
-            )
-            
-            # Display results
-            print(f"Description: {description.text}")
-            print(f"Ingredients: {', '.join(description.ingredients) if description.ingredients else 'Not specified'}")
-            print(f"Dietary Info: {', '.join(description.dietary_restrictions) if description.dietary_restrictions else 'Not specified'}")
-            print(f"Cuisine Type: {description.cuisine_type or 'Not specified'}")
-            print(f"Spice Level: {description.spice_level or 'Not specified'}")
-            print(f"Preparation: {description.preparation_method or 'Not specified'}")
-            print(f"Confidence: {description.confidence:.2f}")
-            
-        except Exception as e:
-            print(f"❌ Error generating description: {e}")
-        
+        # Display results
+        print(f"Description: {description.text}")
+        print(f"Ingredients: {', '.join(description.ingredients) if description.ingredients else 'Not specified'}")
+        print(f"Dietary Info: {', '.join(description.dietary_restrictions) if description.dietary_restrictions else 'Not specified'}")
+        print(f"Cuisine Type: {description.cuisine_type or 'Not specified'}")
+        print(f"Spice Level: {description.spice_level or 'Not specified'}")
+        print(f"Preparation: {description.preparation_method or 'Not specified'}")
+        print(f"Confidence: {description.confidence:.2f}")
         print()
     
     # Test batch processing
@@ -7,6 +7,7 @@ with proper error handling and caching.
 
 import os
 import sys
+import time
 from pathlib import Path
 
 # Add the app directory to the Python path
@@ -61,29 +62,28 @@ def main():
     print(f"\nSearching for images of {len(dishes)} dishes...")
     print("-" * 40)
     
-    for dish in dishes:
+    try:
+        # One batch call issues the searches concurrently instead of one after another
+        results = service.search_food_images_batch(dishes, max_results=3)
+    except Exception as e:
+        print(f"Error searching for dishes: {str(e)}")
+        results = []
+    
+    for dish, images in zip(dishes, results):
         print(f"\nSearching for: {dish}")
+        print(f"Found {len(images)} images:")
         
-        try:
-            # Search for images
-            images = service.search_food_images(dish, max_results=3)
+        for i, image in enumerate(images, 1):
+            print(f"  {i}. {image.title}")
+            print(f"     URL: {image.url}")
+            print(f"     Source: {image.source}")
+            print(f"     Size: {image.width}x{image.height}")
+            print(f"     Status: {image.load_status}")
             
-            print(f"Found {len(images)} images:")
+            if image.source == "placeholder":
+                print("     (This is a placeholder image)")
             
-            for i, image in enumerate(images, 1):
-                print(f"  {i}. {image.title}")
-                print(f"     URL: {image.url}")
-                print(f"     Source: {image.source}")
-                print(f"     Size: {image.width}x{image.height}")
-                print(f"     Status: {image.load_status}")
-                
-                if image.source == "placeholder":
-                    print("     (This is a placeholder image)")
-                
-                print()
-        
-        except Exception as e:
-            print(f"Error searching for {dish}: {str(e)}")
+            print()
     
     # Show search statistics
     print("\nSearch Statistics:")
@@ -100,6 +100,14 @@ def main():
     if cached_images:
         print(f"✓ Retrieved from cache: {cached_images[0].title}")
     
+    # Repeating the batch (with a duplicate) is served from cache without API calls
+    quota_before = service.daily_quota_used
+    start = time.perf_counter()
+    service.search_food_images_batch(dishes + ["Margherita Pizza"], max_results=3)
+    elapsed = time.perf_counter() - start
+    print(f"Repeated batch took {elapsed * 1000:.1f} ms using "
+          f"{service.daily_quota_used - quota_before} API calls")
+    
     # Show cache statistics
     print(f"Cache contains {len(cache.image_search_results)} entries")
     
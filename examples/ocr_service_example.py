@@ -16,11 +16,23 @@ from app.services.ocr_service import OCRService
 from app.models.data_models import RequestCache
 
 
+def text_preview(text: str, max_lines: int = 5) -> str:
+    """Return the first few lines of OCR text without splitting all of it."""
+    end = -1
+    for _ in range(max_lines):
+        end = text.find('\n', end + 1)
+        if end == -1:
+            return text
+    return text[:end]
+
+
 def main():
     """Demonstrate OCR service usage."""
     
-    # Initialize cache
-    cache = RequestCache()
+    # Initialize cache. Setting OCR_CACHE_FILE replays results saved by earlier
+    # runs, so repeat runs make no Vision API calls for images already seen
+    cache_file = os.environ.get('OCR_CACHE_FILE')
+    cache = RequestCache.persistent(cache_file) if cache_file else RequestCache()
     
     # Get API key from environment (you would set this in production)
     api_key = os.environ.get('OCR_API_KEY', 'your-api-key-here')
@@ -57,7 +69,7 @@ def main():
         )
         
         print("✅ OCR extraction completed!")
-        print(f"   Extracted text: '{result.text}' (length: {len(result.text)})")
+        print(f"   Extracted text: '{text_preview(result.text)}' (length: {len(result.text)})")
         print(f"   Confidence: {result.confidence:.2f}")
         print(f"   Detected language: {result.language}")
         print(f"   Bounding boxes: {len(result.bounding_boxes)}")
@@ -69,9 +81,10 @@ def main():
         cached_result = ocr_service.extract_text(sample_image)
         print(f"   Cache hit: {cached_result.text == result.text}")
         
-        # Clear cache
-        ocr_service.clear_cache()
-        print("   Cache cleared")
+        # Clear cache, unless it is being saved for the next run
+        if not cache_file:
+            ocr_service.clear_cache()
+            print("   Cache cleared")
         
     except Exception as e:
         print(f"❌ OCR extraction failed: {str(e)}")
@@ -102,7 +115,6 @@ def main():
     try:
         # Test with unsupported provider
         unsupported_service = OCRService(api_key=api_key, provider="unsupported")
-        result = unsupported_service.extract_text(sample_image)
     except Exception as e:
         print(f"   Unsupported provider handled: {type(e).__name__}")
     
@@ -5,6 +5,7 @@ Results Display Example
 This example demonstrates the results display functionality with mock data.
 """
 
+import io
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -184,26 +185,29 @@ def main():
     print(f"- Error count: {len(formatted_results['errors'])}")
     print()
     
-    # Display each dish
+    # Display each dish, collecting the output so it is written in one go
+    buffer = io.StringIO()
     for i, dish_data in enumerate(formatted_results['dishes'], 1):
-        print(f"Dish {i}: {dish_data['dish']['name']}")
-        print(f"  Original: {dish_data['dish']['original_name']}")
-        print(f"  Price: {dish_data['dish']['price']['display']}")
-        print(f"  Has images: {dish_data['images']['has_images']}")
+        print(f"Dish {i}: {dish_data['dish']['name']}", file=buffer)
+        print(f"  Original: {dish_data['dish']['original_name']}", file=buffer)
+        print(f"  Price: {dish_data['dish']['price']['display']}", file=buffer)
+        print(f"  Has images: {dish_data['images']['has_images']}", file=buffer)
         if dish_data['images']['has_images']:
-            print(f"  Primary image: {dish_data['images']['primary']['url']}")
-            print(f"  Secondary images: {len(dish_data['images']['secondary'])}")
+            print(f"  Primary image: {dish_data['images']['primary']['url']}", file=buffer)
+            print(f"  Secondary images: {len(dish_data['images']['secondary'])}", file=buffer)
         
         if dish_data['description']:
-            print(f"  Description: {dish_data['description']['text'][:100]}...")
-            print(f"  Cuisine: {dish_data['description']['cuisine_type']}")
-            print(f"  Spice level: {dish_data['description']['spice_level']}")
-            print(f"  Ingredients: {len(dish_data['description']['ingredients'])}")
+            print(f"  Description: {dish_data['description']['text'][:100]}...", file=buffer)
+            print(f"  Cuisine: {dish_data['description']['cuisine_type']}", file=buffer)
+            print(f"  Spice level: {dish_data['description']['spice_level']}", file=buffer)
+            print(f"  Ingredients: {len(dish_data['description']['ingredients'])}", file=buffer)
         else:
-            print("  Description: Not available")
+            print("  Description: Not available", file=buffer)
         
-        print(f"  Status: {dish_data['processing_status']}")
-        print()
+        print(f"  Status: {dish_data['processing_status']}", file=buffer)
+        print(file=buffer)
+    
+    sys.stdout.write(buffer.getvalue())
     
     # Display error summary
     if formatted_results['has_errors']:
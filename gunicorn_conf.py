@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for serving the Flask API in production.
+
+Usage:
+    gunicorn -c gunicorn_conf.py "app.app:create_app()"
+
+Menu analysis is dominated by waits on external APIs (OCR, image search,
+descriptions), so gevent workers are used when available: each worker
+multiplexes many in-flight requests instead of blocking on one. Gunicorn's
+gevent worker monkey-patches the standard library, which makes ``requests``
+cooperative without changes to the handlers.
+
+Only one worker process is run: processing results and pending jobs live in
+that process's memory, so an upload handled by one worker and a /status or
+/results poll routed to another would 404. Concurrency comes from gevent or
+threads within the single worker until that state moves to shared storage.
+"""
+
+import importlib.util
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5000')}"
+# Not read from WEB_CONCURRENCY: more workers break the upload -> poll flow (see above)
+workers = 1
+
+if importlib.util.find_spec('gevent') is not None:
+    worker_class = 'gevent'
+    worker_connections = 1000
+else:
+    # Threaded workers still overlap API waits when gevent is not installed
+    worker_class = 'gthread'
+    threads = 16
+
+timeout = 60
+keepalive = 5
+accesslog = '-'
+errorlog = '-'
@@ -1,5 +1,12 @@
 """
 Main entry point for the Menu Image Analyzer application.
+
+This starts Flask's development server. For production, serve the app with
+gunicorn instead:
+
+    gunicorn -c gunicorn_conf.py "app.app:create_app()"
+
+or set FLASK_SERVER=gunicorn to run the same gunicorn setup from here.
 """
 
 from app.app import create_app
@@ -7,6 +14,38 @@ from app.config import get_config
 import os
 
 
+def serve_with_gunicorn(app, host: str, port: int) -> None:
+    """
+    Serve an already-created app with gunicorn, using gunicorn_conf.py settings.
+    
+    Always runs a single worker: processing results and pending jobs are
+    held in this process's memory, so polls routed to another worker would
+    404 until that state is shared.
+    
+    Args:
+        app: Flask application to serve
+        host: Interface to bind
+        port: Port to bind
+    """
+    from gunicorn.app.base import BaseApplication
+    import gunicorn_conf
+    
+    class StandaloneApplication(BaseApplication):
+        def load_config(self):
+            for key, value in vars(gunicorn_conf).items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+            self.cfg.set('bind', f"{host}:{port}")
+            if self.cfg.workers != 1:
+                print(f"Ignoring workers={self.cfg.workers}: results are stored per process, using 1")
+            self.cfg.set('workers', 1)
+        
+        def load(self):
+            return app
+    
+    StandaloneApplication().run()
+
+
 def main():
     """Main function to run the Flask application."""
     # Get configuration based on environment
@@ -14,9 +53,9 @@ def main():
     config = get_config(config_name)
     
     # Create Flask app
-    app = create_app(config.__dict__)
+    app = create_app(config_name)
     
-    # Run the application
+    # Run the development server (see gunicorn_conf.py for production)
     port = int(os.environ.get('PORT', 5000))
     host = os.environ.get('HOST', '0.0.0.0')
     debug = config.DEBUG
@@ -25,7 +64,14 @@ def main():
     print(f"Environment: {config_name}")
     print(f"Debug mode: {debug}")
     
-    app.run(host=host, port=port, debug=debug)
+    # The dev server handles each request on its own thread. Forking worker
+    # processes (processes > 1) is deliberately not offered: each request would
+    # run in a short-lived child, so background analyses and their results die
+    # with it and the follow-up /results polls return 404.
+    if os.environ.get('FLASK_SERVER') == 'gunicorn' and not debug:
+        serve_with_gunicorn(app, host, port)
+    else:
+        app.run(host=host, port=port, debug=debug, threaded=True)
 
 
 if __name__ == "__main__":
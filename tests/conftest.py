@@ -3,40 +3,32 @@ Pytest configuration and fixtures for the Menu Image Analyzer tests.
 """
 
 import pytest
-import tempfile
+import io
 import os
 from typing import Generator
 from app.app import create_app
 
 
-@pytest.fixture
-def app():
-    """Create and configure a test Flask application."""
-    # Create a temporary directory for test uploads
-    temp_dir = tempfile.mkdtemp()
-    
-    config = {
-        'TESTING': True,
-        'UPLOAD_FOLDER': temp_dir,
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    """Create the test Flask application once and share it across the session."""
+    app = create_app('testing')
+    app.config.update({
+        'UPLOAD_FOLDER': str(tmp_path_factory.mktemp('uploads')),
         'SECRET_KEY': 'test-secret-key',
         'MAX_CONTENT_LENGTH': 16 * 1024 * 1024,
         'ALLOWED_EXTENSIONS': {'png', 'jpg', 'jpeg', 'webp'}
-    }
-    
-    app = create_app(config)
+    })
     
     with app.app_context():
         yield app
-    
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture
 def client(app):
-    """Create a test client for the Flask application."""
-    return app.test_client()
+    """Create a fresh test client for the shared Flask application."""
+    with app.test_client() as client:
+        yield client
 
 
 @pytest.fixture
@@ -45,7 +37,7 @@ def runner(app):
     return app.test_cli_runner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_data():
     """Provide sample image data for testing."""
     # Create a minimal valid JPEG header for testing
@@ -70,6 +62,14 @@ def sample_image_data():
     return jpeg_data
 
 
+@pytest.fixture
+def jpg_upload(sample_image_data):
+    """Build multipart form data uploading the sample JPEG."""
+    def build(filename='test.jpg'):
+        return {'file': (io.BytesIO(sample_image_data), filename)}
+    return build
+
+
 @pytest.fixture
 def invalid_file_data():
     """Provide invalid file data for testing."""
@@ -0,0 +1,278 @@
+"""
+Tests for the AI Menu Analyzer module.
+
+This module tests request building, caching and response handling for the
+vision-model menu analyzer without calling the real API.
+"""
+
+import pytest
+import asyncio
+import base64
+import io
+import json
+import httpx
+import requests
+from functools import lru_cache
+from unittest.mock import patch, MagicMock
+from PIL import Image, ImageDraw
+from app.services import ai_menu_analyzer
+from app.services.ai_menu_analyzer import AIMenuAnalyzer
+from app.models.data_models import RequestCache
+
+
+PNG_BYTES = b'\x89PNG\r\n\x1a\n' + b'\x00' * 64
+COMPLETION = {
+    'choices': [{
+        'message': {
+            'content': json.dumps({'dishes': [{'dish_name': 'Pad Thai', 'price': '$12'}]})
+        }
+    }]
+}
+
+
+@lru_cache(maxsize=1)
+def large_photo_bytes():
+    """Return an oversized noisy PNG, encoded once per test run."""
+    image = Image.effect_noise((2400, 1600), 64).convert('RGB')
+    buffer = io.BytesIO()
+    # Skip zlib compression: the bytes only need to be a valid, large PNG
+    image.save(buffer, format='PNG', compress_level=0)
+    return buffer.getvalue()
+
+
+def render_menu(lines):
+    """Render a plain menu page with one dish per line, sharing a fixed layout."""
+    image = Image.new('RGB', (600, 800), 'white')
+    draw = ImageDraw.Draw(image)
+    for row, line in enumerate(lines):
+        draw.text((40, 60 + row * 40), line, fill='black')
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def completion_for(name):
+    """Build a mocked completion response listing a single dish."""
+    body = {'choices': [{'message': {'content': json.dumps({'dishes': [{'dish_name': name, 'price': '$9'}]})}}]}
+    response = MagicMock()
+    response.json.return_value = body
+    response.content = json.dumps(body).encode()
+    return response
+
+
+class TestAIMenuAnalyzer:
+    """Test cases for the AIMenuAnalyzer class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        with patch.dict('os.environ', {'OPENROUTER_API_KEY': 'test-key'}):
+            self.analyzer = AIMenuAnalyzer(cache=RequestCache())
+        self.analyzer.min_request_interval = 0
+
+    def test_requires_api_key(self):
+        """Test that initialization fails without an API key."""
+        with patch.dict('os.environ', {}, clear=True):
+            with pytest.raises(ValueError):
+                AIMenuAnalyzer()
+
+    def test_image_part_detects_mime_type(self):
+        """Test that image parts are labelled with the sniffed MIME type."""
+        png_part = self.analyzer._build_image_part(PNG_BYTES)
+        jpeg_part = self.analyzer._build_image_part(b'\xff\xd8\xff' + b'\x00' * 16)
+
+        assert png_part['image_url']['url'].startswith('data:image/png;base64,')
+        assert jpeg_part['image_url']['url'].startswith('data:image/jpeg;base64,')
+
+    def test_analyze_menu_caches_results(self):
+        """Test that repeat analyses of the same image are served from cache."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = COMPLETION
+        mock_response.content = json.dumps(COMPLETION).encode()
+
+        with patch.object(self.analyzer.session, 'post', return_value=mock_response) as mock_post:
+            first = self.analyzer.analyze_menu(PNG_BYTES)
+            second = self.analyzer.analyze_menu(PNG_BYTES)
+
+        assert mock_post.call_count == 1
+        assert [dish.name for dish in first] == ['Pad Thai']
+        assert second == first
+
+    def test_same_layout_menus_are_analyzed_separately(self):
+        """Test that different menus sharing a layout never reuse each other's analysis."""
+        first_menu = render_menu(['Pad Thai .... $12', 'Green Curry .... $14', 'Spring Rolls .... $6'])
+        second_menu = render_menu(['Ramen .... $13', 'Gyoza .... $7', 'Katsu Curry .... $15'])
+
+        with patch.object(self.analyzer.session, 'post',
+                          side_effect=[completion_for('Pad Thai'), completion_for('Ramen')]) as mock_post:
+            first = self.analyzer.analyze_menu(first_menu)
+            second = self.analyzer.analyze_menu(second_menu)
+
+        assert mock_post.call_count == 2
+        assert [dish.name for dish in first] == ['Pad Thai']
+        assert [dish.name for dish in second] == ['Ramen']
+
+    def test_cache_key_depends_on_model(self):
+        """Test that switching models never reuses another model's analysis."""
+        key = self.analyzer._analysis_cache_key(PNG_BYTES)
+        self.analyzer.model_name = 'other/model'
+
+        assert self.analyzer._analysis_cache_key(PNG_BYTES) != key
+
+    def test_analyze_menu_async(self):
+        """Test the async analysis path over a shared httpx client."""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json=COMPLETION)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await self.analyzer.analyze_menu_async(PNG_BYTES, client=client)
+
+        dishes = asyncio.run(run())
+
+        assert [dish.price for dish in dishes] == ['$12']
+        assert requests_seen[0].headers['Authorization'] == 'Bearer test-key'
+
+    def test_analyze_menu_async_wraps_http_errors(self):
+        """Test that async API failures surface as analysis errors."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+        async def run():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await self.analyzer.analyze_menu_async(PNG_BYTES, client=client)
+
+        with pytest.raises(Exception, match="AI analysis API request failed"):
+            asyncio.run(run())
+
+    def test_analyze_menus_batches_requests(self):
+        """Test that batch analysis keeps input order and sends repeated images once."""
+        other = b'\xff\xd8\xff' + b'\x01' * 16
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request)
+            name = 'Ramen' if '/9j/' in request.content.decode() else 'Pad Thai'
+            return httpx.Response(200, json={'choices': [{'message': {
+                'content': json.dumps({'dishes': [{'dish_name': name}]})
+            }}]})
+        
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        with patch('app.services.ai_menu_analyzer.httpx.AsyncClient',
+                   lambda **kwargs: real_client(transport=transport, **kwargs)):
+            results = self.analyzer.analyze_menus([PNG_BYTES, other, PNG_BYTES])
+        
+        assert len(requests_seen) == 2
+        assert [[dish.name for dish in dishes] for dishes in results] == [['Pad Thai'], ['Ramen'], ['Pad Thai']]
+        assert results[0] is not results[2]
+    
+    def test_analyze_menu_stream_yields_dishes_incrementally(self):
+        """Test that streamed completions yield each dish once its object is complete."""
+        content = json.dumps({'dishes': [
+            {'dish_name': 'Phở', 'price': '$9'},
+            {'dish_name': 'Bánh Mì', 'price': None},
+            {'dish_name': 'Gỏi Cuốn', 'price': '$6'}
+        ]}, ensure_ascii=False)
+        chunks = [content[i:i + 7] for i in range(0, len(content), 7)]
+        lines = [': OPENROUTER PROCESSING', '']
+        lines += [f"data: {json.dumps({'choices': [{'delta': {'content': chunk}}]}, ensure_ascii=False)}"
+                  for chunk in chunks]
+        lines.append('data: [DONE]')
+        body = '\n'.join(lines).encode('utf-8')
+
+        # A real response without a charset, as OpenRouter sends it
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'text/event-stream'
+        response.raw = io.BytesIO(body)
+
+        with patch.object(self.analyzer.session, 'post', return_value=response) as mock_post:
+            stream = self.analyzer.analyze_menu_stream(PNG_BYTES)
+            first = next(stream)
+            assert first.name == 'Phở'
+            assert response.raw.tell() < len(body)
+            rest = list(stream)
+
+        assert json.loads(mock_post.call_args.kwargs['data'])['stream'] is True
+        assert [dish.name for dish in rest] == ['Bánh Mì', 'Gỏi Cuốn']
+        assert [dish.name for dish in self.analyzer.analyze_menu_stream(PNG_BYTES)] == ['Phở', 'Bánh Mì', 'Gỏi Cuốn']
+
+    def test_large_images_are_downscaled(self):
+        """Test that oversized photos are resized to JPEG before upload."""
+        original = large_photo_bytes()
+
+        part = self.analyzer._build_image_part(original)
+        header, encoded = part['image_url']['url'].split(',', 1)
+        resized = Image.open(io.BytesIO(base64.b64decode(encoded)))
+
+        assert header == 'data:image/jpeg;base64'
+        assert max(resized.size) == 1568
+        assert len(encoded) < len(original)
+
+    def test_small_images_are_sent_unchanged(self):
+        """Test that images already within limits are not re-encoded."""
+        part = self.analyzer._build_image_part(PNG_BYTES)
+
+        assert base64.b64decode(part['image_url']['url'].split(',', 1)[1]) == PNG_BYTES
+
+    def test_payload_marks_prompt_as_cacheable(self):
+        """Test that the static prompt leads the message and carries a cache hint."""
+        content = self.analyzer._build_payload(PNG_BYTES)['messages'][0]['content']
+
+        assert content[0]['cache_control'] == {'type': 'ephemeral'}
+        assert content[0]['text'] == self.analyzer._get_analysis_prompt()
+        assert content[1]['type'] == 'image_url'
+    
+    def test_data_url_encoding_matches_base64(self):
+        """Test that chunked encoding produces the same data URL as one-shot base64."""
+        image_data = bytes(range(256)) * 700 + b'\x01'
+        
+        url = ai_menu_analyzer._encode_data_url('image/png', image_data)
+        
+        assert url == 'data:image/png;base64,' + base64.b64encode(image_data).decode('ascii')
+    
+    def test_shared_cache_serves_other_workers(self):
+        """Test that analyses from the Redis tier are reused and promoted into memory."""
+        self.analyzer._shared_cache = MagicMock()
+        self.analyzer._shared_cache.get.return_value = json.dumps([{'name': 'Pho', 'price': '$9'}])
+        
+        with patch.object(self.analyzer.session, 'post') as mock_post:
+            dishes = self.analyzer.analyze_menu(PNG_BYTES)
+        
+        mock_post.assert_not_called()
+        assert [dish.name for dish in dishes] == ['Pho']
+        key = self.analyzer._analysis_cache_key(PNG_BYTES)
+        assert self.analyzer.cache.get_ai_analysis_result(key) == dishes
+    
+    @pytest.mark.parametrize('raw', ['[{"name": "Pho"', json.dumps([{'price': '$9'}])])
+    def test_corrupt_shared_cache_entry_is_reanalyzed(self, raw):
+        """Test that unreadable Redis entries fall through to the model."""
+        self.analyzer._shared_cache = MagicMock()
+        self.analyzer._shared_cache.get.return_value = raw
+        mock_response = MagicMock()
+        mock_response.json.return_value = COMPLETION
+        mock_response.content = json.dumps(COMPLETION).encode()
+        
+        with patch.object(self.analyzer.session, 'post', return_value=mock_response) as mock_post:
+            dishes = self.analyzer.analyze_menu(PNG_BYTES)
+        
+        mock_post.assert_called_once()
+        assert dishes
+    
+    def test_results_are_written_to_shared_cache(self):
+        """Test that fresh analyses are stored in Redis with a TTL."""
+        self.analyzer._shared_cache = MagicMock()
+        self.analyzer._shared_cache.get.return_value = None
+        mock_response = MagicMock()
+        mock_response.json.return_value = COMPLETION
+        mock_response.content = json.dumps(COMPLETION).encode()
+        
+        with patch.object(self.analyzer.session, 'post', return_value=mock_response):
+            self.analyzer.analyze_menu(PNG_BYTES)
+        
+        key, ttl, value = self.analyzer._shared_cache.setex.call_args.args
+        assert key == 'menureader:analysis:' + self.analyzer._analysis_cache_key(PNG_BYTES)
+        assert ttl == 3600
+        assert json.loads(value)[0]['name'] == 'Pad Thai'
@@ -4,7 +4,15 @@ Tests for the main Flask application.
 
 import pytest
 import io
+import threading
+import time
+from unittest.mock import patch
 from app.app import create_app, allowed_file
+from app.models.data_models import MenuAnalysisResult
+from app.services.menu_processor import MenuProcessor
+
+
+ALLOWED_EXTENSIONS = frozenset({'jpg', 'png', 'webp'})
 
 
 class TestFlaskApp:
@@ -69,10 +77,9 @@ class TestFlaskApp:
         response_data = response.get_json()
         assert response_data['error'] == 'Invalid file type'
     
-    def test_upload_valid_image(self, client, sample_image_data):
+    def test_upload_valid_image(self, client, jpg_upload):
         """Test upload endpoint with valid image."""
-        data = {'file': (io.BytesIO(sample_image_data), 'test.jpg')}
-        response = client.post('/upload', data=data)
+        response = client.post('/upload', data=jpg_upload())
         assert response.status_code == 200
         
         response_data = response.get_json()
@@ -105,32 +112,57 @@ class TestFlaskApp:
         data = response.get_json()
         assert 'error' in data
         assert data['error'] == 'Results not found'
+    
+    def test_upload_processes_in_background(self, client, jpg_upload):
+        """Test that uploads return before analysis finishes and results can be polled."""
+        release = threading.Event()
+        
+        def slow_process(self, image_data, processing_id=None, progress_callback=None):
+            release.wait(5)
+            return MenuAnalysisResult(success=True, processing_time=0.1)
+        
+        with patch.object(MenuProcessor, 'process_menu', slow_process):
+            processing_id = client.post('/upload', data=jpg_upload()).get_json()['processing_id']
+            
+            pending = client.get(f'/results/{processing_id}')
+            assert pending.status_code == 202
+            assert pending.get_json()['complete'] is False
+            assert client.get(f'/status/{processing_id}').get_json()['status'] == 'processing'
+            
+            release.set()
+            for _ in range(50):
+                response = client.get(f'/results/{processing_id}')
+                if response.status_code == 200:
+                    break
+                time.sleep(0.01)
+        
+        assert response.get_json()['complete'] is True
+        assert response.get_json()['success'] is True
 
 
 class TestUtilityFunctions:
     """Test cases for utility functions."""
     
-    def test_allowed_file_valid_extensions(self):
-        """Test allowed_file function with valid extensions."""
-        allowed_extensions = {'jpg', 'png', 'webp'}
-        
-        assert allowed_file('test.jpg', allowed_extensions) is True
-        assert allowed_file('test.JPG', allowed_extensions) is True
-        assert allowed_file('test.png', allowed_extensions) is True
-        assert allowed_file('test.webp', allowed_extensions) is True
-    
-    def test_allowed_file_invalid_extensions(self):
-        """Test allowed_file function with invalid extensions."""
-        allowed_extensions = {'jpg', 'png', 'webp'}
-        
-        assert allowed_file('test.txt', allowed_extensions) is False
-        assert allowed_file('test.pdf', allowed_extensions) is False
-        assert allowed_file('test.gif', allowed_extensions) is False
-        assert allowed_file('test', allowed_extensions) is False
+    @pytest.mark.parametrize('filename, expected', [
+        ('test.jpg', True),
+        ('test.JPG', True),
+        ('test.png', True),
+        ('test.webp', True),
+        ('test.txt', False),
+        ('test.pdf', False),
+        ('test.gif', False),
+        ('test', False),
+        ('', False),
+    ])
+    def test_allowed_file(self, filename, expected):
+        """Test allowed_file against valid, invalid and missing extensions."""
+        assert allowed_file(filename, ALLOWED_EXTENSIONS) is expected
     
-    def test_allowed_file_no_extension(self):
-        """Test allowed_file function with no extension."""
-        allowed_extensions = {'jpg', 'png', 'webp'}
+    def test_orjson_provider_indent(self):
+        """Test that the orjson provider only pretty-prints when an indent is requested."""
+        pytest.importorskip('orjson')
+        app = create_app('testing')
         
-        assert allowed_file('test', allowed_extensions) is False
-        assert allowed_file('', allowed_extensions) is False
\ No newline at end of file
+        assert app.json.dumps({'a': 1}) == '{"a":1}'
+        assert app.json.dumps({'a': 1}, indent=None) == '{"a":1}'
+        assert app.json.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
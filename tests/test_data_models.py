@@ -6,6 +6,7 @@ Run: pytest tests/test_data_models.py
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 from app.models.data_models import (
     Dish, EnrichedDish, FoodImage, DishDescription, 
     ProcessingState, ProcessingError, ProcessingStep, ErrorType,
@@ -13,6 +14,16 @@ from app.models.data_models import (
 )
 
 
+_SHARED_CACHE = RequestCache()
+
+
+@pytest.fixture
+def cache():
+    """Provide one reusable RequestCache, emptied before every test."""
+    _SHARED_CACHE.clear()
+    return _SHARED_CACHE
+
+
 class TestDish:
     """Test cases for the Dish model."""
     
@@ -153,10 +164,8 @@ class TestProcessingError:
 class TestRequestCache:
     """Test cases for the RequestCache class."""
     
-    def test_cache_operations(self):
+    def test_cache_operations(self, cache):
         """Test basic cache operations."""
-        cache = RequestCache()
-        
         # Test OCR result caching
         ocr_result = OCRResult(text="test text", confidence=0.9)
         cache.set_ocr_result("hash123", ocr_result)
@@ -182,6 +191,55 @@ class TestRequestCache:
         assert cache.get_ocr_result("hash123") is None
         assert cache.get_image_search_result("pasta") is None
         assert cache.get_description("pasta") is None
+    
+    def test_ai_analysis_cache_stats_and_eviction(self, cache, monkeypatch):
+        """Test AI analysis caching counts hits/misses and evicts least recently used entries."""
+        monkeypatch.setattr(cache, 'AI_ANALYSIS_MAX_ENTRIES', 2)
+        dishes = [ParsedDish(name="Pho", price="$9", confidence=0.9)]
+        
+        assert cache.get_ai_analysis_result("a") is None
+        cache.set_ai_analysis_result("a", dishes)
+        cache.set_ai_analysis_result("b", [])
+        assert cache.get_ai_analysis_result("a") == dishes
+        assert cache.get_ai_analysis_result("b") == []
+        
+        cache.set_ai_analysis_result("c", dishes)
+        assert cache.get_ai_analysis_result("a") is None
+        
+        stats = cache.get_stats()
+        assert stats['ai_analysis_results'] == 2
+        assert stats['ai_analysis_hits'] == 2
+        assert stats['ai_analysis_misses'] == 2
+        
+        cache.clear()
+        stats = cache.get_stats()
+        assert (stats['ai_analysis_hits'], stats['ai_analysis_misses']) == (0, 0)
+    
+    def test_ai_analysis_cache_expires(self, cache, monkeypatch):
+        """Test that AI analysis entries expire after their TTL."""
+        monkeypatch.setattr(cache, 'AI_ANALYSIS_TTL', -1.0)
+        cache.set_ai_analysis_result("a", [])
+        
+        assert cache.get_ai_analysis_result("a") is None
+        assert "a" not in cache.ai_analysis_results
+    
+    def test_persistent_cache_round_trip(self, tmp_path):
+        """Test that a persistent cache reloads saved entries and drops stale files."""
+        path = str(tmp_path / "cache" / "menureader.pkl")
+        dishes = [ParsedDish(name="Pho", price="$9", confidence=0.9)]
+        
+        with patch('app.models.data_models.atexit.register'):
+            cache = RequestCache.persistent(path)
+            cache.set_ocr_result("hash123", OCRResult(text="menu", confidence=0.8))
+            cache.set_ai_analysis_result("a", dishes)
+            cache.flush()
+            
+            reloaded = RequestCache.persistent(path)
+            assert reloaded.get_ocr_result("hash123").text == "menu"
+            assert reloaded.get_ai_analysis_result("a") == dishes
+            
+            stale = RequestCache.persistent(path, ttl=-1)
+            assert stale.get_ocr_result("hash123") is None
 
 
 class TestAPIConfig:
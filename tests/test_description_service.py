@@ -12,6 +12,21 @@ from app.services.description_service import DescriptionService
 from app.models.data_models import DishDescription
 
 
+# Model replies for the batch test, keyed by the dish named in each prompt
+BATCH_RESPONSES = {
+    f"Dish {i + 1}": json.dumps({"text": f"Description for dish {i}", "confidence": 0.8})
+    for i in range(3)
+}
+
+
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Replace the OpenAI client class with one shared mock client."""
+    client = Mock()
+    monkeypatch.setattr('app.services.description_service.OpenAI', lambda *args, **kwargs: client)
+    return client
+
+
 class TestDescriptionService:
     """Test cases for the DescriptionService class."""
     
@@ -28,12 +43,10 @@ class TestDescriptionService:
             assert service.api_key is None
             assert service.client is None
     
-    def test_is_available_with_client(self):
+    def test_is_available_with_client(self, mock_openai):
         """Test availability check when client is configured."""
-        with patch('app.services.description_service.OpenAI') as mock_openai:
-            mock_openai.return_value = Mock()
-            service = DescriptionService(api_key="test-key")
-            assert service.is_available() is True
+        service = DescriptionService(api_key="test-key")
+        assert service.is_available() is True
     
     def test_is_available_without_client(self):
         """Test availability check when client is not configured."""
@@ -125,13 +138,8 @@ class TestDescriptionService:
         assert description.text == "Test description"
         assert description.confidence == 0.8
     
-    @patch('app.services.description_service.OpenAI')
     def test_generate_description_success(self, mock_openai):
         """Test successful description generation."""
-        # Mock the OpenAI client and response
-        mock_client = Mock()
-        mock_openai.return_value = mock_client
-        
         mock_response = Mock()
         mock_response.choices = [Mock()]
         mock_response.choices[0].message.content = json.dumps({
@@ -140,7 +148,7 @@ class TestDescriptionService:
             "confidence": 0.85
         })
         
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai.chat.completions.create.return_value = mock_response
         
         service = DescriptionService(api_key="test-key")
         description = service.generate_description("Pad Thai", "$12.95")
@@ -149,12 +157,9 @@ class TestDescriptionService:
         assert "rice noodles" in description.ingredients
         assert description.confidence == 0.85
     
-    @patch('app.services.description_service.OpenAI')
     def test_generate_description_api_error(self, mock_openai):
         """Test description generation with API error."""
-        mock_client = Mock()
-        mock_openai.return_value = mock_client
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        mock_openai.chat.completions.create.side_effect = Exception("API Error")
         
         service = DescriptionService(api_key="test-key")
         description = service.generate_description("Test Dish")
@@ -174,25 +179,15 @@ class TestDescriptionService:
         assert description.text == "A delicious Test Dish dish."
         assert description.confidence == 0.1
     
-    @patch('app.services.description_service.OpenAI')
     def test_generate_batch_descriptions(self, mock_openai):
         """Test batch description generation."""
-        mock_client = Mock()
-        mock_openai.return_value = mock_client
+        # Calls run concurrently, so answer each one based on the dish in its prompt
+        def create(**kwargs):
+            prompt = kwargs['messages'][1]['content']
+            content = next(reply for dish, reply in BATCH_RESPONSES.items() if dish in prompt)
+            return Mock(choices=[Mock(message=Mock(content=content))])
         
-        # Mock responses for each dish
-        responses = [
-            json.dumps({"text": f"Description for dish {i}", "confidence": 0.8})
-            for i in range(3)
-        ]
-        
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        
-        # Set up side effect to return different responses
-        mock_client.chat.completions.create.side_effect = [
-            Mock(choices=[Mock(message=Mock(content=resp))]) for resp in responses
-        ]
+        mock_openai.chat.completions.create.side_effect = create
         
         service = DescriptionService(api_key="test-key")
         dishes = [
@@ -0,0 +1,81 @@
+"""
+Tests for the Google Vision OCR Service.
+
+This module tests batched text extraction over the Vision REST API
+without making real network calls.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.services.google_vision_ocr_service import GoogleVisionOCRService
+from app.services.service_utils import hash_image
+from app.models.data_models import OCRResult, RequestCache
+
+
+def vision_response(*texts):
+    """Build a REST images:annotate response with one entry per text."""
+    return {
+        "responses": [
+            {"textAnnotations": [{"description": text}]} if text else {}
+            for text in texts
+        ]
+    }
+
+
+@pytest.fixture(scope="module", autouse=True)
+def ocr_environment():
+    """Point the service at a fake REST key once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('OCR_API_KEY', 'test-key')
+        mp.delenv('GOOGLE_APPLICATION_CREDENTIALS', raising=False)
+        yield
+
+
+class TestGoogleVisionOCRService:
+    """Test cases for the GoogleVisionOCRService class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = GoogleVisionOCRService(cache=RequestCache())
+        self.service.min_request_interval = 0
+    
+    @patch('requests.Session.post')
+    def test_extract_text_batch_chunks_requests(self, mock_post):
+        """Test that images are sent 16 per request and returned in input order."""
+        images = [f"image-{i}".encode() for i in range(20)]
+        
+        def annotate(url, json, headers, timeout):
+            response = Mock()
+            response.json.return_value = vision_response(
+                *[f"menu {i}" for i in range(len(json["requests"]))]
+            )
+            return response
+        
+        mock_post.side_effect = annotate
+        
+        results = self.service.extract_text_batch(images)
+        
+        assert mock_post.call_count == 2
+        assert [len(call.kwargs['json']['requests']) for call in mock_post.call_args_list] == [16, 4]
+        assert [result.text for result in results[14:18]] == ["menu 14", "menu 15", "menu 0", "menu 1"]
+    
+    @patch('requests.Session.post')
+    def test_extract_text_batch_skips_cached_and_duplicate_images(self, mock_post):
+        """Test that cached images and repeats within a batch are not re-sent."""
+        cached = OCRResult(text="cached menu", confidence=0.9, language="en")
+        self.service.cache.set_ocr_result(hash_image(b"old"), cached)
+        mock_post.return_value.json.return_value = vision_response("fresh menu")
+        
+        results = self.service.extract_text_batch([b"new", b"old", b"new"])
+        
+        assert len(mock_post.call_args.kwargs['json']['requests']) == 1
+        assert [result.text for result in results] == ["fresh menu", "cached menu", "fresh menu"]
+    
+    @patch('requests.Session.post')
+    def test_extract_text_batch_raises_on_image_error(self, mock_post):
+        """Test that a per-image API error fails the batch like extract_text would."""
+        mock_post.return_value.json.return_value = {"responses": [{"error": {"message": "bad image"}}]}
+        
+        with pytest.raises(Exception, match="Google Vision OCR processing failed"):
+            self.service.extract_text_batch([b"broken"])
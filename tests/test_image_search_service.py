@@ -6,6 +6,7 @@ including API integration, quality filtering, caching, and error handling.
 """
 
 import pytest
+import httpx
 from unittest.mock import Mock, patch, MagicMock
 import requests
 from app.services.image_search_service import ImageSearchService
@@ -34,6 +35,12 @@ class TestImageSearchService:
         assert self.service.timeout == 30
         assert self.service.min_request_interval == 1.0
     
+    def test_services_share_http_session(self):
+        """Test that every service instance reuses one pooled session."""
+        other = ImageSearchService(api_key="other_key", search_engine_id="other_engine")
+        
+        assert other.session is self.service.session
+    
     def test_empty_dish_name_returns_placeholder(self):
         """Test that empty dish name returns placeholder images."""
         # Test empty string
@@ -213,6 +220,53 @@ class TestImageSearchService:
                 # Should have called sleep for rate limiting on second request
                 mock_sleep.assert_called()
     
+    def test_search_batch_runs_concurrently_and_keeps_order(self):
+        """Test that batch searches share one async client and return results in input order."""
+        self.service.min_request_interval = 0
+        self.cache.set_image_search_result("pizza", [FoodImage(
+            url="https://example.com/cached.jpg", thumbnail_url="https://example.com/cached_thumb.jpg",
+            title="Cached Pizza", source="example.com", width=400, height=300
+        )])
+        queries = []
+        
+        def handler(request):
+            queries.append(request.url.params['q'])
+            dish = request.url.params['q'].replace(' dish', '')
+            return httpx.Response(200, json={'items': [{
+                'link': f'https://example.com/{dish}.jpg',
+                'title': f'Fresh {dish}',
+                'displayLink': 'example.com',
+                'image': {'thumbnailLink': f'https://example.com/{dish}_thumb.jpg', 'width': '500', 'height': '400'}
+            }]})
+        
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        with patch('app.services.image_search_service.httpx.AsyncClient',
+                   lambda **kwargs: real_client(transport=transport, **kwargs)):
+            results = self.service.search_food_images_batch(["ramen", "pizza", "tacos"])
+        
+        assert sorted(queries) == ["ramen dish", "tacos dish"]
+        assert [images[0].url for images in results] == [
+            'https://example.com/ramen.jpg', 'https://example.com/cached.jpg', 'https://example.com/tacos.jpg'
+        ]
+        assert self.service.daily_quota_used == 2
+        assert self.cache.get_image_search_result("tacos")[0].title == 'Fresh tacos'
+    
+    def test_search_batch_searches_repeated_dishes_once(self):
+        """Test that duplicate dishes in a batch share a single API request."""
+        self.service.min_request_interval = 0
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={'items': []}))
+        
+        real_client = httpx.AsyncClient
+        with patch('app.services.image_search_service.httpx.AsyncClient',
+                   lambda **kwargs: real_client(transport=transport, **kwargs)):
+            results = self.service.search_food_images_batch(["Pizza", "pizza ", "PIZZA"])
+        
+        assert self.service.daily_quota_used == 1
+        assert len(results) == 3
+        assert results[0] == results[1] == results[2]
+        assert results[0] is not results[1]
+    
     def test_quota_tracking(self):
         """Test daily quota tracking."""
         initial_quota = self.service.daily_quota_used
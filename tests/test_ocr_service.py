@@ -6,11 +6,16 @@ caching, error handling, and API integration.
 """
 
 import pytest
+import gzip
+import json
 import hashlib
-from unittest.mock import Mock, patch, MagicMock
+import time
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+import httpx
 import requests
 
 from app.services.ocr_service import OCRService
+from app.services.service_utils import hash_image
 from app.models.data_models import OCRResult, RequestCache
 
 
@@ -48,6 +53,14 @@ class TestOCRService:
         assert service.provider == "azure"
         assert service.timeout == 60
     
+    def test_session_shared_between_instances(self):
+        """Test that OCR services reuse one pooled HTTP session."""
+        first = OCRService(api_key="key_one")
+        second = OCRService(api_key="key_two", provider="azure")
+        
+        assert first.session is second.session
+        assert first.session.get_adapter("https://vision.googleapis.com")._pool_maxsize == 64
+    
     def test_cache_functionality(self):
         """Test OCR result caching."""
         image_hash = hashlib.md5(self.test_image).hexdigest()
@@ -104,6 +117,7 @@ class TestOCRService:
                 }
             }]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         # Test extraction
@@ -147,6 +161,7 @@ class TestOCRService:
                 }]
             }]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         # Test extraction
@@ -184,6 +199,7 @@ class TestOCRService:
         mock_response.json.return_value = {
             "responses": [{}]  # Empty response
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         service = OCRService(api_key="test_key", provider="google_vision")
@@ -197,23 +213,40 @@ class TestOCRService:
     def test_rate_limiting(self):
         """Test rate limiting functionality."""
         service = OCRService(api_key="test_key")
-        service.min_request_interval = 0.1  # 100ms
+        service._capacity = 1
+        service._tokens = 1
+        service._refill_rate = 10.0  # 100ms per token
         
-        import time
-        start_time = time.time()
+        # Measure on the bucket's own clock: the second call sleeps for whatever
+        # part of the 100ms refill has not elapsed since the first, so the total
+        # can never come in under one token interval
+        start_time = time.monotonic()
         
         # Simulate multiple rapid requests
         service._enforce_rate_limit()
         service._enforce_rate_limit()
         
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         assert elapsed_time >= 0.1  # Should have been rate limited
     
+    def test_rate_limit_allows_burst(self):
+        """Test that idle time accumulates tokens so bursts pass without sleeping."""
+        service = OCRService(api_key="test_key")
+        
+        start_time = time.time()
+        
+        for _ in range(int(service._capacity)):
+            service._enforce_rate_limit()
+        
+        elapsed_time = time.time() - start_time
+        assert elapsed_time < 0.1
+    
     def test_language_support(self):
         """Test language support functionality."""
         # Test Google Vision language support
         service = OCRService(api_key="test_key", provider="google_vision")
         languages = service.get_supported_languages()
+        assert isinstance(languages, list)
         assert "en" in languages
         assert "es" in languages
         assert "fr" in languages
@@ -243,7 +276,7 @@ class TestOCRService:
             bounding_boxes=[]
         )
         
-        image_hash = hashlib.md5(self.test_image).hexdigest()
+        image_hash = hash_image(self.test_image)
         self.cache.set_ocr_result(image_hash, mock_result)
         
         # This should return cached result without making API call
@@ -276,10 +309,8 @@ class TestOCRService:
     
     def test_unsupported_provider(self):
         """Test handling of unsupported OCR provider."""
-        service = OCRService(api_key="test_key", provider="unsupported_provider")
-        
-        with pytest.raises(Exception) as exc_info:
-            service.extract_text(self.test_image)
+        with pytest.raises(ValueError) as exc_info:
+            OCRService(api_key="test_key", provider="unsupported_provider")
         
         assert "Unsupported OCR provider" in str(exc_info.value)
     
@@ -304,6 +335,7 @@ class TestOCRService:
                 }
             }]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         service = OCRService(api_key="test_key", provider="google_vision")
@@ -313,10 +345,83 @@ class TestOCRService:
         
         # Verify language hints were passed in request
         call_args = mock_post.call_args
-        request_data = call_args[1]["json"]
+        assert call_args[1]["headers"]["Content-Encoding"] == "gzip"
+        request_data = json.loads(gzip.decompress(call_args[1]["data"]))
         image_context = request_data["requests"][0]["imageContext"]
         assert image_context["languageHints"] == ["es", "en"]
 
+    
+    @patch('app.services.ocr_service.requests.Session.post')
+    @patch('app.services.ocr_service.requests.Session.get')
+    def test_validate_api_key(self, mock_get, mock_post):
+        """Test API key validation via the lightweight discovery request."""
+        mock_get.return_value = Mock(status_code=200)
+        assert self.service.validate_api_key() is True
+        mock_post.assert_not_called()
+        
+        mock_get.return_value = Mock(status_code=403)
+        assert self.service.validate_api_key() is False
+        
+        # Falls back to a full OCR request when the discovery endpoint is unreachable
+        mock_get.side_effect = requests.exceptions.ConnectionError("unreachable")
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {"responses": [{}]}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_post.return_value = mock_response
+        assert self.service.validate_api_key() is True
+        mock_post.assert_called_once()
+        
+        assert OCRService(api_key="").validate_api_key() is False
+    
+    @patch('app.services.ocr_service.httpx.AsyncClient.post', new_callable=AsyncMock)
+    def test_extract_text_batch(self, mock_post):
+        """Test concurrent OCR of several images in one batch."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = {
+            "responses": [{
+                "textAnnotations": [{"description": "Soup of the day $6"}]
+            }]
+        }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_post.return_value = mock_response
+        
+        images = [self.test_image, b"second_image", b"third_image"]
+        results = self.service.extract_text_batch(images)
+        
+        assert len(results) == 3
+        assert all(result.text == "Soup of the day $6" for result in results)
+        assert mock_post.call_count == 3
+        
+        # Batch results are cached like single extractions
+        assert self.cache.get_ocr_result(hash_image(b"second_image")) is not None
+        results = self.service.extract_text_batch(images)
+        assert mock_post.call_count == 3
+    
+    @patch('app.services.ocr_service.httpx.AsyncClient.post', new_callable=AsyncMock)
+    def test_batch_rate_limit_response_drains_bucket(self, mock_post):
+        """Test that a 429 on the async batch path empties the local token bucket."""
+        request = httpx.Request("POST", "https://vision.googleapis.com/v1/images:annotate")
+        mock_post.return_value = httpx.Response(429, request=request)
+        
+        with pytest.raises(Exception, match="OCR API request failed"):
+            self.service.extract_text_batch([self.test_image])
+        
+        assert self.service._tokens <= 0
+    
+    @patch('app.services.ocr_service.requests.Session.post')
+    def test_rate_limit_response_drains_bucket(self, mock_post):
+        """Test that a 429 from a single extraction empties the local token bucket."""
+        response = requests.Response()
+        response.status_code = 429
+        mock_post.return_value = response
+        
+        with pytest.raises(Exception, match="OCR API request failed"):
+            self.service.extract_text(self.test_image)
+        
+        assert self.service._tokens <= 0
+
 
 class TestOCRServiceIntegration:
     """Integration tests for OCR service with real-world scenarios."""
@@ -6,6 +6,7 @@ This module tests Property 3: Language-Agnostic Processing
 """
 
 import pytest
+import json
 from hypothesis import given, strategies as st, settings
 from unittest.mock import Mock, patch
 import hashlib
@@ -69,6 +70,7 @@ class TestLanguageAgnosticProcessingProperty:
                 }
             }]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         # The key property: OCR should not fail regardless of language
@@ -151,6 +153,7 @@ class TestLanguageAgnosticProcessingProperty:
                 }
             }]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         # Test image data
@@ -237,6 +240,7 @@ class TestLanguageAgnosticProcessingProperty:
                 } if language_code != "empty_language" else {}
             }]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         test_image = b"test_image_data"
@@ -285,6 +289,7 @@ class TestLanguageAgnosticProcessingProperty:
                 }
             }]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         # Test the same image multiple times
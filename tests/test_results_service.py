@@ -5,6 +5,7 @@ This module tests the results display and formatting functionality.
 """
 
 import pytest
+import json
 from app.services.results_service import ResultsService
 from app.models.data_models import (
     Dish, EnrichedDish, FoodImage, DishDescription, ProcessingError, ErrorType
@@ -200,6 +201,35 @@ class TestResultsService:
         assert len(result['errors']) == 2
         assert result['success'] is True  # Still successful if we have dishes
     
+    def test_format_results_as_json(self):
+        """Test serializing enriched dishes directly to JSON."""
+        dish = Dish(
+            name="Margherita Pizza",
+            original_name="Pizza Margherita",
+            price="$12.99",
+            confidence=0.9
+        )
+        
+        enriched_dish = EnrichedDish(
+            dish=dish,
+            images={'primary': FoodImage(url="https://example.com/pizza.jpg",
+                                         thumbnail_url="https://example.com/pizza_thumb.jpg")},
+            description=DishDescription(text="Classic pizza", ingredients=["tomato", "mozzarella"]),
+            processing_status="complete"
+        )
+        
+        errors = [ProcessingError(type=ErrorType.DESCRIPTION, message="Slow response")]
+        
+        result = json.loads(self.results_service.format_results_as_json([enriched_dish], errors))
+        
+        assert result['total_count'] == 1
+        assert result['success'] is True
+        assert result['has_errors'] is True
+        assert result['dishes'][0]['dish']['name'] == "Margherita Pizza"
+        assert result['dishes'][0]['images']['primary']['url'] == "https://example.com/pizza.jpg"
+        assert result['dishes'][0]['description']['ingredients'] == ["tomato", "mozzarella"]
+        assert result['errors'][0]['type'] == "description"
+    
     def test_create_error_summary(self):
         """Test creating error summary for display."""
         errors = [
@@ -317,4 +347,15 @@ class TestResultsService:
         result = self.results_service._format_price("  $15.99  ")
         assert result['has_price'] is True
         assert result['display'] == "$15.99"
-        assert result['original'] == "  $15.99  "
\ No newline at end of file
+        assert result['original'] == "  $15.99  "
+    
+    def test_format_price_repeated_values(self):
+        """Test that repeated prices give equal but independent dictionaries."""
+        first = self.results_service._format_price("$12.99")
+        second = self.results_service._format_price("$12.99")
+        
+        assert first == second
+        assert first is not second
+        
+        first['display'] = "changed"
+        assert self.results_service._format_price("$12.99")['display'] == "$12.99"
@@ -0,0 +1,190 @@
+"""
+Tests for the Secure API Client module.
+
+This module tests credential handling, rate limiting and request plumbing
+without making real network calls.
+"""
+
+import pytest
+import queue
+import time
+import requests
+from collections import deque
+from unittest.mock import patch, MagicMock
+from app.services import secure_api_client
+from app.services.secure_api_client import (
+    SecureAPIClient, APIProvider, APICredentials, RateLimitConfig, get_client
+)
+
+
+class TestSecureAPIClient:
+    """Test cases for the SecureAPIClient class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        secure_api_client._read_env.cache_clear()
+        with patch.dict('os.environ', {}, clear=True):
+            self.client = SecureAPIClient()
+        secure_api_client._read_env.cache_clear()
+        self.client.add_credentials(APIProvider.OPENAI, 'sk-test-key-123456')
+
+    def test_get_client_returns_shared_instance(self):
+        """Test that get_client hands out one process-wide client."""
+        with patch.object(secure_api_client, '_CLIENT', None):
+            first = get_client()
+            second = get_client()
+
+        assert first is second
+        assert first.session is second.session
+
+    def test_make_request_requires_credentials(self):
+        """Test that unconfigured providers are rejected."""
+        with pytest.raises(ValueError):
+            self.client.make_request(APIProvider.GOOGLE_SEARCH, 'GET', 'https://example.com')
+
+    def test_make_request_adds_auth_headers(self):
+        """Test that requests carry provider authentication and tracking headers."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        with patch.object(self.client.session, 'request', return_value=mock_response) as mock_request:
+            self.client.make_request(
+                APIProvider.OPENAI, 'GET', 'https://api.openai.com/v1/models',
+                headers={'authorization': 'Bearer stale', 'X-Trace': 'abc'}
+            )
+
+        headers = mock_request.call_args.kwargs['headers']
+        assert headers['Authorization'] == 'Bearer sk-test-key-123456'
+        assert headers['x-trace'] == 'abc'
+        assert len(headers) == 5
+        assert len(headers['X-Request-ID']) == 16
+
+    def test_request_windows_expire_old_entries(self):
+        """Test that sliding-window counts drop timestamps as they age out."""
+        with patch('app.services.secure_api_client.time.time', return_value=1000.0):
+            self.client._update_request_history(APIProvider.OPENAI)
+            self.client._update_request_history(APIProvider.OPENAI)
+
+        assert self.client._window_counts(APIProvider.OPENAI, 1000.5) == (2, 2, 2)
+        assert self.client._window_counts(APIProvider.OPENAI, 1030.0) == (0, 2, 2)
+        assert self.client._window_counts(APIProvider.OPENAI, 5000.0) == (0, 0, 0)
+        assert len(self.client.request_history[APIProvider.OPENAI]) == 0
+
+    def test_request_windows_mutate_under_lock(self):
+        """Test that the shared client only touches its sliding windows while holding the history lock."""
+        lock = self.client._history_lock
+
+        class GuardedDeque(deque):
+            def append(self, item):
+                assert lock.locked()
+                super().append(item)
+
+            def popleft(self):
+                assert lock.locked()
+                return super().popleft()
+
+        windows = tuple(GuardedDeque() for _ in secure_api_client._RATE_WINDOWS)
+        self.client._request_windows[APIProvider.OPENAI] = windows
+
+        with patch('app.services.secure_api_client.time.time', return_value=1000.0):
+            self.client._update_request_history(APIProvider.OPENAI)
+        assert self.client._window_counts(APIProvider.OPENAI, 5000.0) == (0, 0, 0)
+
+    def test_rate_limit_allows_burst_then_paces(self):
+        """Test that permits allow a burst and are then refilled in the background."""
+        config = RateLimitConfig(requests_per_second=10.0, capacity=2)
+        self.client.rate_limits[APIProvider.OPENAI] = config
+        self.client._permits[APIProvider.OPENAI] = self.client._full_permit_queue(config)
+
+        start = time.monotonic()
+        self.client._enforce_rate_limit(APIProvider.OPENAI)
+        self.client._enforce_rate_limit(APIProvider.OPENAI)
+        assert time.monotonic() - start < 0.05
+
+        self.client._enforce_rate_limit(APIProvider.OPENAI)
+        assert 0.05 < time.monotonic() - start < 1.0
+        assert self.client._refiller.is_alive()
+
+    def test_rate_limit_times_out_without_permits(self):
+        """Test that an exhausted provider fails fast once the timeout passes."""
+        self.client.timeout = 0.01
+        self.client._permits[APIProvider.OPENAI] = queue.Queue(maxsize=1)
+        self.client._refiller = MagicMock()
+
+        with pytest.raises(requests.exceptions.Timeout):
+            self.client._enforce_rate_limit(APIProvider.OPENAI)
+
+    def test_provider_status_is_memoised(self):
+        """Test that status snapshots are reused until credentials change."""
+        first = self.client.get_provider_status()
+        assert self.client.get_provider_status() is first
+        assert first['openai']['configured'] is True
+        assert first['google_search']['configured'] is False
+
+        self.client.add_credentials(APIProvider.GOOGLE_SEARCH, 'search-key-123456', {'engine_id': 'cx'})
+        refreshed = self.client.get_provider_status()
+        assert refreshed is not first
+        assert refreshed['google_search']['configured'] is True
+
+    def test_default_rate_limits_are_shared_constants(self):
+        """Test that clients copy the module-level default rate limits."""
+        assert self.client.rate_limits == dict(secure_api_client._DEFAULT_RATE_LIMITS)
+        assert self.client.rate_limits is not secure_api_client._DEFAULT_RATE_LIMITS
+        assert self.client.rate_limits[APIProvider.OPENAI].capacity == 3.0
+
+    def test_log_request_redacts_api_keys(self, caplog):
+        """Test that logged URLs never include API key values."""
+        with caplog.at_level('DEBUG', logger='app.services.secure_api_client'):
+            self.client._log_request(
+                APIProvider.GOOGLE_SEARCH, 'GET',
+                'https://www.googleapis.com/customsearch/v1?key=secret123&q=pasta', 200
+            )
+
+        assert 'secret123' not in caplog.text
+        assert 'key=***&q=pasta' in caplog.text
+
+    def test_masked_key(self):
+        """Test that API keys are masked for display."""
+        assert self.client.credentials[APIProvider.OPENAI].get_masked_key() == 'sk-t**********3456'
+        assert APICredentials(APIProvider.OPENAI, 'short').get_masked_key() == '*****'
+
+    def test_validate_all_credentials(self):
+        """Test that every configured provider is probed and failures are contained."""
+        self.client.add_credentials(APIProvider.GOOGLE_SEARCH, 'search-key-123456', {'engine_id': 'cx'})
+
+        with patch.object(self.client, '_test_openai', return_value=True), \
+             patch.object(self.client, '_test_google_search', side_effect=RuntimeError('boom')):
+            results = self.client.validate_all_credentials()
+
+        assert results == {'openai': True, 'google_search': False}
+
+    def test_shared_rate_limit_retries_until_admitted(self):
+        """Test that a full Redis window makes the caller wait and re-check until it is admitted."""
+        limit = self.client.rate_limits[APIProvider.OPENAI].requests_per_minute
+        self.client._redis_window = MagicMock(side_effect=[b'30.0', b'0.001', b'0'])
+
+        with patch('app.services.secure_api_client.time.time', return_value=1000.0), \
+             patch('app.services.secure_api_client.time.sleep') as mock_sleep:
+            self.client._enforce_rate_limit(APIProvider.OPENAI)
+
+        calls = self.client._redis_window.call_args_list
+        assert len(calls) == 3
+        assert calls[0].kwargs['keys'] == ['menureader:ratelimit:openai']
+        assert calls[0].kwargs['args'][:3] == [1000.0, 60, limit]
+        # The same request ID is retried, so a request is recorded at most once
+        assert len({call.kwargs['args'][3] for call in calls}) == 1
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [30.0, secure_api_client._MIN_RATE_LIMIT_WAIT]
+
+    def test_check_api_errors_logs_known_failures(self, caplog):
+        """Test that provider-specific failures are logged and successes are ignored."""
+        ok, quota = MagicMock(status_code=200), MagicMock(status_code=403)
+
+        with caplog.at_level('WARNING', logger='app.services.secure_api_client'):
+            self.client._check_api_errors(APIProvider.GOOGLE_VISION, ok)
+            self.client._check_api_errors(APIProvider.OPENAI, quota)
+            assert caplog.records == []
+
+            self.client._check_api_errors(APIProvider.GOOGLE_VISION, quota)
+
+        assert caplog.records[0].levelname == 'ERROR'
+        assert 'Google Vision API quota exceeded' in caplog.text
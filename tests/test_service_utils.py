@@ -0,0 +1,67 @@
+"""
+Tests for the shared service helpers.
+
+This module tests the pooled sessions, JSON helpers and request pacing
+shared by the API service clients.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+from app.services.service_utils import (
+    RequestPacingMixin, dump_json, get_pooled_session, hash_image, parse_json
+)
+
+
+class PacedClient(RequestPacingMixin):
+    """Minimal client using the pacing mixin."""
+
+    def __init__(self, interval):
+        self.min_request_interval = interval
+        self.last_request_time = 0
+
+
+class TestServiceUtils:
+    """Test cases for the shared service helpers."""
+
+    def test_sessions_are_shared_per_pool_settings(self):
+        """Test that services asking for the same pool settings share one session."""
+        assert get_pooled_session(64, 64) is get_pooled_session(64, 64)
+        assert get_pooled_session(64, 64) is not get_pooled_session(32, 64, retry_post=True)
+
+    def test_post_retries_are_opt_in(self):
+        """Test that POSTs are only retried when the API never processed them."""
+        default_retry = get_pooled_session(64, 64).get_adapter('https://').max_retries
+        post_retry = get_pooled_session(32, 64, retry_post=True).get_adapter('https://').max_retries
+
+        assert not default_retry.is_retry('POST', 429)
+        assert default_retry.is_retry('GET', 503)
+        assert post_retry.is_retry('POST', 429)
+        assert not post_retry.is_retry('POST', 503)
+        assert post_retry.read == 0
+
+    def test_json_round_trip(self):
+        """Test that compact encoding and decoding agree with the stdlib."""
+        payload = {'dishes': [{'dish_name': 'Phở', 'price': None}]}
+
+        assert parse_json(dump_json(payload)) == payload
+        assert parse_json(json.dumps(payload)) == payload
+        with pytest.raises(json.JSONDecodeError):
+            parse_json('{"dishes": [')
+
+    def test_hash_image_is_stable(self):
+        """Test that image fingerprints depend only on the bytes."""
+        assert hash_image(b'menu') == hash_image(b'menu')
+        assert hash_image(b'menu') != hash_image(b'menu2')
+
+    def test_requests_are_paced(self):
+        """Test that back-to-back requests reserve consecutive slots."""
+        client = PacedClient(0.5)
+
+        with patch('app.services.service_utils.time.time', return_value=1000.0), \
+             patch('app.services.service_utils.time.sleep') as mock_sleep:
+            client._enforce_rate_limit()
+            client._enforce_rate_limit()
+            client._enforce_rate_limit()
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]